@@ -1,48 +1,44 @@
 import os
 import sys
 import shutil
+import stat
+import errno
 import datetime
 import threading
 import logging
 import time
 import hashlib
-import base64
-import mimetypes
-import re
-import subprocess
+import hmac
+import queue
+import mmap
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Set, Union, Callable
 from functools import partial, lru_cache
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 
-# For encryption
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
-from Crypto.Random import get_random_bytes
+# For encryption - the cipher library is imported on first use by
+# _load_crypto_backend() so it does not slow down application startup
+CRYPTO_BACKEND = None
+from os import urandom as get_random_bytes
 
 # For UI
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QFileDialog, QTreeView, QCheckBox, 
+    QPushButton, QLabel, QFileDialog, QCheckBox, 
     QLineEdit, QProgressBar, QTabWidget, QSplitter, QFrame, 
-    QListWidget, QListWidgetItem, QAbstractItemView, QMessageBox,
-    QComboBox, QGroupBox, QRadioButton, QButtonGroup, QScrollArea,
-    QSizePolicy, QStackedWidget, QToolButton, QMenu, QAction,
-    QTextEdit, QDialog, QDialogButtonBox, QGridLayout, QSpacerItem,
-    QGraphicsDropShadowEffect, QDesktopWidget, QStyle, QStyleOption,
-    QListView, QFileSystemModel, QToolBar, QStatusBar, QInputDialog
+    QMessageBox, QGroupBox, QButtonGroup, QScrollArea,
+    QToolButton, QMenu, QAction, QTextEdit, QDialog,
+    QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect, QStyle, QInputDialog,
+    qDrawBorderPixmap
 )
 from PyQt5.QtGui import (
     QIcon, QPixmap, QPalette, QColor, QFont, QFontDatabase, 
-    QStandardItemModel, QStandardItem, QCursor, QKeySequence,
-    QDragEnterEvent, QDropEvent, QPainter, QBrush, QLinearGradient,
-    QGradient, QPen, QFontMetrics, QPainterPath, QImage
+    QCursor, QPainter, QPen, QPainterPath, QImage, QImageReader
 )
 from PyQt5.QtCore import (
-    Qt, QSize, QThread, pyqtSignal, QModelIndex, QDir, QFile, 
-    QFileInfo, QUrl, QMimeData, QRect, QPoint, QTimer, QEvent,
-    QPropertyAnimation, QEasingCurve, QByteArray, QBuffer, QIODevice,
-    QSortFilterProxyModel
+    Qt, QSize, QThread, pyqtSignal, QRect, QRectF, QPoint, QTimer, QEvent, QStandardPaths,
+    QMargins, QObject, QRunnable, QThreadPool
 )
 
 # Set up logging
@@ -57,8 +53,37 @@ logger = logging.getLogger("FileOrganizer")
 APP_NAME = "FileOrganizer Pro"
 APP_VERSION = "1.0.0"
 DEFAULT_ENCRYPTION_EXTENSION = ".encrypted"
-BUFFER_SIZE = 65536  # 64kb chunks for file operations
-MAX_WORKERS = min(8, os.cpu_count() or 4)  # Maximum number of worker threads for parallel processing
+BUFFER_SIZE = 1024 * 1024  # 1MB chunks for file operations (lets AES-NI pipelining saturate)
+KDF_ITERATIONS = 100000  # PBKDF2-HMAC-SHA256 rounds for password-derived keys
+PREALLOCATE_MIN_SIZE = 64 * 1024 * 1024  # Reserve disk space up front for outputs this large
+DROP_CACHE_MIN_SIZE = 64 * 1024 * 1024  # Write back and drop written-once outputs this large from the page cache
+PIPELINE_DEPTH = 4  # Chunks queued between the read, cipher and write stages of large files
+MMAP_MAX_SIZE = 256 * 1024 * 1024  # GCM-encrypt smaller files with one call over memory maps
+
+# ===== CUSTOMIZABLE: ENCRYPTION FORMAT =====
+# "gcm" writes a headered AES-GCM file that also detects tampering,
+# "ctr" writes a headered AES-CTR file whose segments are encrypted in parallel,
+# "cbc" writes the original salt + IV + AES-CBC layout readable by every version.
+# All three formats can always be decrypted.
+ENCRYPTION_MODE = "gcm"
+ENCRYPTED_MAGIC = b"FOPE"  # Marks files that start with a header and mode byte
+# "gcm-stream" is GCM with the tag after the data, used where the output cannot seek
+ENCRYPTION_MODE_IDS = {"ctr": 2, "gcm": 3, "gcm-stream": 4}
+CTR_SEGMENT_SIZE = 4 * 1024 * 1024  # Bytes per parallel CTR segment (multiple of 16)
+# Worker thread counts: copying/moving files mostly waits on the disk, so it is
+# oversubscribed to hide syscall latency, while AES work is CPU-bound
+IO_WORKERS = min(32, (os.cpu_count() or 4) * 4)  # Threads for file copy/move operations
+CPU_WORKERS = os.cpu_count() or 4  # Threads for encryption and hashing
+ORGANIZE_BATCH_SIZE = 32  # Files handed to a copy thread per task
+PROGRESS_EMIT_EVERY = 16  # Emit worker progress at least every N files...
+PROGRESS_EMIT_INTERVAL = 0.05  # ...or once this many seconds have passed
+DIRECTORY_SCAN_BATCH = 1000  # Folder entries handed to the file view at a time while scanning
+# CUSTOMIZABLE: Send deleted files to the system trash when send2trash is installed,
+# instead of removing them permanently
+DELETE_TO_TRASH = True
+# CUSTOMIZABLE: Opt in to hardlinking the date copy to the type copy when organizing by
+# both, instead of writing the data twice (editing one copy then changes the other)
+ORGANIZE_HARDLINK_BOTH = False
 
 # File type categories and their extensions
 FILE_CATEGORIES = {
@@ -79,6 +104,30 @@ FILE_CATEGORIES = {
     "Others": []  # Will catch anything not in the above categories
 }
 
+# Extension -> category lookup, built once so categorizing a file is a single dict hit
+EXT_TO_CATEGORY: Dict[str, str] = {
+    ext: category for category, exts in FILE_CATEGORIES.items() for ext in exts
+}
+
+# CUSTOMIZABLE: Icon color and label for each file category
+CATEGORY_ICONS: Dict[str, Tuple[str, str]] = {
+    "Images": ("#FF7675", "IMG"),
+    "Videos": ("#6C5CE7", "VID"),
+    "Audio": ("#00B894", "AUD"),
+    "Documents": ("#0984E3", "DOC"),
+    "PDF": ("#E84393", "PDF"),
+    "Excel": ("#00B894", "XLS"),
+    "PowerPoint": ("#E84393", "PPT"),
+    "Text": ("#74B9FF", "TXT"),
+    "Archives": ("#A29BFE", "ZIP"),
+    "Code": ("#00CEC9", "CODE"),
+    "Executables": ("#FD79A8", "EXE"),
+    "APK": ("#55EFC4", "APK"),
+    "Encrypted": ("#636E72", "ENC"),
+}
+# Icon for categories without an entry above
+DEFAULT_CATEGORY_ICON = ("#B2BEC3", "FILE")
+
 # Theme colors based on Teamify dashboard
 class AppTheme:
     # ===== CUSTOMIZABLE: THEME COLORS =====
@@ -112,6 +161,9 @@ class AppTheme:
     FONT_SIZE_LARGE = 16        # Large text size
     FONT_SIZE_XLARGE = 20       # Extra large text size
     
+    # Stylesheet text, built on first use by stylesheet()
+    _stylesheet_cache: Optional[str] = None
+    
     @staticmethod
     def setup_application_style(app: QApplication) -> None:
         """Apply the application-wide stylesheet"""
@@ -141,6 +193,14 @@ class AppTheme:
         except:
             pass
         
+        app.setStyleSheet(AppTheme.stylesheet())
+    
+    @staticmethod
+    def stylesheet() -> str:
+        """Build the application stylesheet once and return the cached text"""
+        if AppTheme._stylesheet_cache is not None:
+            return AppTheme._stylesheet_cache
+        
         # ===== CUSTOMIZABLE: APPLICATION STYLESHEET =====
         # Set application-wide stylesheet - Modify these values to change the appearance of UI elements
         stylesheet = f"""
@@ -532,22 +592,43 @@ class AppTheme:
         }}
         """
         
-        app.setStyleSheet(stylesheet)
+        AppTheme._stylesheet_cache = stylesheet
+        return stylesheet
+
+class _LRUCache(OrderedDict):
+    """Dictionary that evicts its least recently used entries beyond a capacity"""
+    def __init__(self, capacity: int):
+        super().__init__()
+        self.capacity = capacity
+    
+    def get(self, key, default=None):
+        """Get an entry and mark it as recently used"""
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+    
+    def __setitem__(self, key, value):
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        if len(self) > self.capacity:
+            self.popitem(last=False)
 
 # Create icons for file types
 class FileIcons:
     """Class to manage file type icons"""
     
-    # Cache for icons to improve performance
-    _icon_cache = {}
+    # Icons are painted at runtime (so the CUSTOMIZABLE colors and fonts below
+    # apply) and memoized, so each one is drawn only once per session
+    
+    # Cache for image thumbnails, bounded so long sessions do not grow forever
+    _thumbnail_cache = _LRUCache(2048)  # CUSTOMIZABLE: Number of cached thumbnails
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_folder_icon():
         """Create a proper folder icon"""
-        cache_key = "folder"
-        if cache_key in FileIcons._icon_cache:
-            return FileIcons._icon_cache[cache_key]
-            
         pixmap = QPixmap(64, 64)  # CUSTOMIZABLE: Folder icon size
         pixmap.fill(Qt.transparent)
         
@@ -574,17 +655,12 @@ class FileIcons:
         
         painter.end()
         
-        icon = QIcon(pixmap)
-        FileIcons._icon_cache[cache_key] = icon
-        return icon
+        return QIcon(pixmap)
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def create_back_icon():
         """Create a back arrow icon"""
-        cache_key = "back"
-        if cache_key in FileIcons._icon_cache:
-            return FileIcons._icon_cache[cache_key]
-            
         pixmap = QPixmap(24, 24)  # CUSTOMIZABLE: Back icon size
         pixmap.fill(Qt.transparent)
         
@@ -603,17 +679,12 @@ class FileIcons:
         
         painter.end()
         
-        icon = QIcon(pixmap)
-        FileIcons._icon_cache[cache_key] = icon
-        return icon
+        return QIcon(pixmap)
     
     @staticmethod
+    @lru_cache(maxsize=64)
     def create_icon(color, text):
         """Create an icon with the given color and text"""
-        cache_key = f"{color}_{text}"
-        if cache_key in FileIcons._icon_cache:
-            return FileIcons._icon_cache[cache_key]
-            
         pixmap = QPixmap(64, 64)  # CUSTOMIZABLE: File icon size
         pixmap.fill(Qt.transparent)
         
@@ -633,116 +704,464 @@ class FileIcons:
         
         painter.end()
         
-        icon = QIcon(pixmap)
-        FileIcons._icon_cache[cache_key] = icon
-        return icon
+        return QIcon(pixmap)
     
     @staticmethod
-    def get_file_icon(file_path):
-        """Get an appropriate icon for a file based on its type"""
-        # Check if we already have this icon cached by path
-        if file_path in FileIcons._icon_cache:
-            return FileIcons._icon_cache[file_path]
-            
-        if os.path.isdir(file_path):
+    def get_file_icon(file_path, is_dir: Optional[bool] = None):
+        """Get an appropriate icon for a file based on its type (pass is_dir to skip the stat)"""
+        if is_dir is None:
+            is_dir = os.path.isdir(file_path)
+        if is_dir:
             # Use proper folder icon for directories
-            icon = FileIcons.create_folder_icon()
-        else:
-            category = get_file_category(file_path)
-            
-            if category == "Images":
-                icon = FileIcons.create_icon("#FF7675", "IMG")
-            elif category == "Videos":
-                icon = FileIcons.create_icon("#6C5CE7", "VID")
-            elif category == "Audio":
-                icon = FileIcons.create_icon("#00B894", "AUD")
-            elif category == "Documents":
-                icon = FileIcons.create_icon("#0984E3", "DOC")
-            elif category == "PDF":
-                icon = FileIcons.create_icon("#E84393", "PDF")
-            elif category == "Excel":
-                icon = FileIcons.create_icon("#00B894", "XLS")
-            elif category == "PowerPoint":
-                icon = FileIcons.create_icon("#E84393", "PPT")
-            elif category == "Text":
-                icon = FileIcons.create_icon("#74B9FF", "TXT")
-            elif category == "Archives":
-                icon = FileIcons.create_icon("#A29BFE", "ZIP")
-            elif category == "Code":
-                icon = FileIcons.create_icon("#00CEC9", "CODE")
-            elif category == "Executables":
-                icon = FileIcons.create_icon("#FD79A8", "EXE")
-            elif category == "APK":
-                icon = FileIcons.create_icon("#55EFC4", "APK")
-            elif category == "Encrypted":
-                icon = FileIcons.create_icon("#636E72", "ENC")
-            else:
-                icon = FileIcons.create_icon("#B2BEC3", "FILE")
+            return FileIcons.create_folder_icon()
         
-        # Cache the icon by path
-        FileIcons._icon_cache[file_path] = icon
-        return icon
+        # Icons are shared per category so the cache does not grow with every path
+        return FileIcons.get_category_icon(get_file_category(file_path))
+    
+    @staticmethod
+    def get_category_icon(category):
+        """Get the icon for a file category (create_icon memoizes the painting)"""
+        color, text = CATEGORY_ICONS.get(category, DEFAULT_CATEGORY_ICON)
+        return FileIcons.create_icon(color, text)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def standard_icon(standard_pixmap):
+        """Get a standard icon of the application style, looked up once"""
+        return QApplication.style().standardIcon(standard_pixmap)
 
 # Utility functions
-@lru_cache(maxsize=1024)
+def get_file_extension(file_path: str) -> str:
+    """Get the lowercased extension of a path (with the dot), or "" if it has none"""
+    # rpartition avoids the tuple and special-casing overhead of os.path.splitext
+    head, dot, ext = file_path.rpartition('.')
+    # No dot, or the last dot is inside a folder name
+    if not dot or '/' in ext or '\\' in ext:
+        return ""
+    # As with splitext, leading dots of a name never start an extension (".bashrc", "..foo")
+    name = head[max(head.rfind('/'), head.rfind('\\')) + 1:]
+    if not name.strip('.'):
+        return ""
+    return '.' + ext.lower()
+
 def get_file_category(file_path: str) -> str:
     """Determine the category of a file based on its extension"""
-    ext = os.path.splitext(file_path)[1].lower()
+    return EXT_TO_CATEGORY.get(get_file_extension(file_path), "Others")
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """Stat a path, or return None if it does not exist or cannot be read"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+def get_file_date(file_path: Union[str, os.DirEntry, os.stat_result],
+                  date_type: str = "modified") -> datetime.datetime:
+    """Get the creation or modification date of a file
     
-    for category, extensions in FILE_CATEGORIES.items():
-        if ext in extensions:
-            return category
+    Accepts a path, an os.DirEntry or an already fetched os.stat_result so
+    callers holding metadata from a directory scan avoid another stat call.
+    """
+    if isinstance(file_path, os.stat_result):
+        st = file_path
+    elif isinstance(file_path, os.DirEntry):
+        st = file_path.stat()
+    else:
+        st = os.stat(file_path)
     
-    return "Others"
-
-def get_file_date(file_path: str, date_type: str = "modified") -> datetime.datetime:
-    """Get the creation or modification date of a file"""
     if date_type == "created":
-        timestamp = os.path.getctime(file_path)
+        timestamp = st.st_ctime
     else:  # modified
-        timestamp = os.path.getmtime(file_path)
+        timestamp = st.st_mtime
     
     return datetime.datetime.fromtimestamp(timestamp)
 
+_SIZE_UNITS = [("B", 1), ("KB", 1024), ("MB", 1024 ** 2), ("GB", 1024 ** 3), ("TB", 1024 ** 4)]
+
 def format_size(size_bytes: int) -> str:
     """Format file size from bytes to human-readable format"""
+    # Fast path for small, zero and negative sizes
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    
+    # Every unit is 2**10 times the previous one, so the bit length picks it directly
+    unit, divisor = _SIZE_UNITS[min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)]
+    return f"{size_bytes / divisor:.1f} {unit}"
+
+@lru_cache(maxsize=1)
+def _cpu_flags() -> Optional[frozenset]:
+    """Read the CPU feature flags from /proc/cpuinfo (None if unavailable)"""
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    return frozenset(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return None
+
+def _cpu_has_sha_ni() -> Optional[bool]:
+    """Check whether the CPU advertises SHA extensions (None if unknown)"""
+    flags = _cpu_flags()
+    if flags is None:
+        return None
+    return "sha_ni" in flags or "sha2" in flags
+
+def _cpu_has_aes_ni() -> Optional[bool]:
+    """Check whether the CPU advertises AES instructions (None if unknown)"""
+    flags = _cpu_flags()
+    if flags is None:
+        return None
+    return "aes" in flags
+
+logger.debug(f"Available hash algorithms: {sorted(hashlib.algorithms_available)}")
+if _cpu_has_sha_ni() is False:
+    logger.warning("CPU lacks SHA extensions; password key derivation will use the slower software path")
+if _cpu_has_aes_ni() is False:
+    logger.warning("CPU lacks AES instructions; encryption will use the slower software path")
+
+@lru_cache(maxsize=32)
+def _derive_key_cached(password: str, salt: bytes) -> Tuple[bytes, bytes]:
+    """Run PBKDF2 for a (password, salt) pair, cached so repeated operations are free"""
+    # hashlib delegates to OpenSSL, which uses SHA-NI when the CPU supports it and
+    # hand-tuned scalar assembly when it does not, so there is no slow Python
+    # loop left for a JIT (e.g. Numba) fallback to speed up
+    key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, KDF_ITERATIONS, 32)
+    return key, salt
 
 def derive_key_from_password(password: str, salt: bytes = None) -> Tuple[bytes, bytes]:
     """Derive an encryption key from a password"""
     if salt is None:
         salt = get_random_bytes(16)
-    
+
     # Use PBKDF2 to derive a key from the password
-    key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000, 32)
+    return _derive_key_cached(password, salt)
+
+def _load_crypto_backend() -> str:
+    """Import the cipher library on first use and return the backend name"""
+    global CRYPTO_BACKEND, Cipher, algorithms, modes, sym_padding, InvalidTag, AES, pad, unpad
+    if CRYPTO_BACKEND is None:
+        # Prefer cryptography (OpenSSL EVP, AES-NI across large updates) and
+        # fall back to pycryptodome when it is not installed
+        try:
+            from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+            from cryptography.hazmat.primitives import padding as sym_padding
+            from cryptography.exceptions import InvalidTag
+            backend = "cryptography"
+        except ImportError:
+            from Crypto.Cipher import AES
+            from Crypto.Util.Padding import pad, unpad
+            backend = "pycryptodome"
+        # Publish the backend name last so other threads never see it half-loaded
+        CRYPTO_BACKEND = backend
+        logger.debug(f"Encryption backend: {CRYPTO_BACKEND}")
+    return CRYPTO_BACKEND
+
+class _AESCBCEncryptor:
+    """Streaming AES-256-CBC encryptor that applies PKCS#7 padding on finalize"""
+    def __init__(self, key: bytes, iv: bytes):
+        if _load_crypto_backend() == "cryptography":
+            self._cipher = Cipher(algorithms.AES(key), modes.CBC(iv)).encryptor()
+            self._padder = sym_padding.PKCS7(128).padder()
+        else:
+            self._cipher = AES.new(key, AES.MODE_CBC, iv)
+            self._pending = b""
     
-    return key, salt
+    def update(self, data: bytes) -> bytes:
+        """Encrypt as many whole blocks of data as are available"""
+        if CRYPTO_BACKEND == "cryptography":
+            return self._cipher.update(self._padder.update(data))
+        
+        data = self._pending + data
+        cut = len(data) - len(data) % 16
+        self._pending = data[cut:]
+        return self._cipher.encrypt(data[:cut])
+    
+    def finalize(self) -> bytes:
+        """Pad and encrypt the remaining bytes"""
+        if CRYPTO_BACKEND == "cryptography":
+            return self._cipher.update(self._padder.finalize()) + self._cipher.finalize()
+        return self._cipher.encrypt(pad(self._pending, 16))
 
-def get_file_thumbnail(file_path: str, size: int = 64) -> QPixmap:
-    """Generate a thumbnail for a file"""
-    # Check if we have a cached thumbnail
-    cache_key = f"thumb_{file_path}_{size}"
-    if cache_key in FileIcons._icon_cache:
-        return FileIcons._icon_cache[cache_key].pixmap(size, size)
+class _AESCBCDecryptor:
+    """Streaming AES-256-CBC decryptor that strips PKCS#7 padding on finalize"""
+    def __init__(self, key: bytes, iv: bytes):
+        if _load_crypto_backend() == "cryptography":
+            self._cipher = Cipher(algorithms.AES(key), modes.CBC(iv)).decryptor()
+            self._unpadder = sym_padding.PKCS7(128).unpadder()
+        else:
+            self._cipher = AES.new(key, AES.MODE_CBC, iv)
+            self._pending = b""
+    
+    def update(self, data: bytes) -> bytes:
+        """Decrypt the available blocks, holding back the last one for unpadding"""
+        if CRYPTO_BACKEND == "cryptography":
+            return self._unpadder.update(self._cipher.update(data))
+        
+        data = self._pending + data
+        cut = max(0, len(data) - (len(data) % 16 or 16))
+        self._pending = data[cut:]
+        return self._cipher.decrypt(data[:cut])
+    
+    def finalize(self) -> bytes:
+        """Decrypt the final block and strip the padding (ValueError if invalid)"""
+        if CRYPTO_BACKEND == "cryptography":
+            return self._unpadder.update(self._cipher.finalize()) + self._unpadder.finalize()
+        if len(self._pending) != 16:
+            raise ValueError("Encrypted data is not a multiple of the block size")
+        return unpad(self._cipher.decrypt(self._pending), 16)
+
+class _AESGCMEncryptor:
+    """Streaming AES-256-GCM encryptor whose finalize returns the 16 byte tag"""
+    def __init__(self, key: bytes, nonce: bytes):
+        if _load_crypto_backend() == "cryptography":
+            self._cipher = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+        else:
+            self._cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+    
+    def update(self, data: bytes) -> bytes:
+        """Encrypt a chunk of data"""
+        if CRYPTO_BACKEND == "cryptography":
+            return self._cipher.update(data)
+        return self._cipher.encrypt(data)
+    
+    def update_into(self, data, out: bytearray) -> int:
+        """Encrypt a chunk into a caller owned buffer and return the byte count"""
+        if CRYPTO_BACKEND == "cryptography":
+            return self._cipher.update_into(data, out)
+        self._cipher.encrypt(data, output=memoryview(out)[:len(data)])
+        return len(data)
+    
+    def finalize(self) -> bytes:
+        """Finish the stream and return the authentication tag"""
+        if CRYPTO_BACKEND == "cryptography":
+            self._cipher.finalize()
+            return self._cipher.tag
+        return self._cipher.digest()
+
+class _AESGCMDecryptor:
+    """Streaming AES-256-GCM decryptor that verifies the tag on finalize"""
+    def __init__(self, key: bytes, nonce: bytes, tag: Optional[bytes] = None):
+        if _load_crypto_backend() == "cryptography":
+            self._cipher = Cipher(algorithms.AES(key), modes.GCM(nonce, tag)).decryptor()
+        else:
+            self._cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+        self._tag = tag
+    
+    def update(self, data: bytes) -> bytes:
+        """Decrypt a chunk of data (not trustworthy until finalize succeeds)"""
+        if CRYPTO_BACKEND == "cryptography":
+            return self._cipher.update(data)
+        return self._cipher.decrypt(data)
+    
+    def update_into(self, data, out: bytearray) -> int:
+        """Decrypt a chunk into a caller owned buffer and return the byte count"""
+        if CRYPTO_BACKEND == "cryptography":
+            return self._cipher.update_into(data, out)
+        self._cipher.decrypt(data, output=memoryview(out)[:len(data)])
+        return len(data)
+    
+    def finalize(self, tag: Optional[bytes] = None) -> None:
+        """Verify the authentication tag (ValueError if the data or password is wrong)"""
+        if CRYPTO_BACKEND == "cryptography":
+            try:
+                if self._tag is None:
+                    self._cipher.finalize_with_tag(tag)
+                else:
+                    self._cipher.finalize()
+            except InvalidTag:
+                raise ValueError("Authentication tag mismatch")
+            return
+        self._cipher.verify(self._tag if self._tag is not None else tag)
+
+def _gcm_crypt_stream(infile, outfile, cipher) -> None:
+    """Run the rest of infile through a GCM cipher into outfile using reused buffers"""
+    in_buffer = bytearray(BUFFER_SIZE)
+    in_view = memoryview(in_buffer)
+    # cryptography's update_into wants one block of headroom in the output
+    out_buffer = bytearray(BUFFER_SIZE + 16)
+    out_view = memoryview(out_buffer)
     
-    default_icon = FileIcons.get_file_icon(file_path)
-    default_pixmap = default_icon.pixmap(size, size)
+    # Small files finish in one chunk, larger ones are worth overlapping I/O with AES
+    n = infile.readinto(in_buffer)
+    if not n:
+        return
+    outfile.write(out_view[:cipher.update_into(in_view[:n], out_buffer)])
+    if n == BUFFER_SIZE:
+        _gcm_crypt_pipeline(infile, outfile, cipher)
+        return
     
+    while True:
+        n = infile.readinto(in_buffer)
+        if not n:
+            break
+        outfile.write(out_view[:cipher.update_into(in_view[:n], out_buffer)])
+
+def _gcm_crypt_pipeline(infile, outfile, cipher) -> None:
+    """Read, cipher and write the rest of infile on three threads with bounded queues"""
+    read_queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+    write_queue = queue.Queue(maxsize=PIPELINE_DEPTH)
+    stop = threading.Event()
+    errors = []
+    
+    def reader():
+        try:
+            while not stop.is_set():
+                chunk = infile.read(BUFFER_SIZE)
+                read_queue.put(chunk)
+                if not chunk:
+                    return
+        except Exception as e:
+            errors.append(e)
+        read_queue.put(b"")
+    
+    def writer():
+        while True:
+            data = write_queue.get()
+            if data is None:
+                return
+            # Keep draining after a failure so the cipher stage never blocks
+            if not errors:
+                try:
+                    outfile.write(data)
+                except Exception as e:
+                    errors.append(e)
+    
+    # Output buffers are reused round robin; one queue of chunks, one being
+    # written and one being filled can be in use at the same time
+    out_buffers = [bytearray(BUFFER_SIZE + 16) for _ in range(PIPELINE_DEPTH + 2)]
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    writer_thread = threading.Thread(target=writer, daemon=True)
+    reader_thread.start()
+    writer_thread.start()
+    try:
+        index = 0
+        while not errors:
+            chunk = read_queue.get()
+            if not chunk:
+                break
+            out_buffer = out_buffers[index % len(out_buffers)]
+            write_queue.put(memoryview(out_buffer)[:cipher.update_into(chunk, out_buffer)])
+            index += 1
+    finally:
+        stop.set()
+        # Unblock the reader if it is waiting on a full queue
+        while reader_thread.is_alive():
+            try:
+                read_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        write_queue.put(None)
+        writer_thread.join()
+    
+    if errors:
+        raise errors[0]
+
+def _key_check_value(key: bytes) -> bytes:
+    """Short key fingerprint stored in headers so a wrong password is detected"""
+    return hmac.new(key, b"FileOrganizer key check", hashlib.sha256).digest()[:8]
+
+def _aes_ctr_transform(key: bytes, nonce: bytes, block_offset: int, data: bytes) -> bytes:
+    """Encrypt or decrypt data with AES-CTR starting at the given block offset"""
+    counter = ((int.from_bytes(nonce, "big") + block_offset) % (1 << 128)).to_bytes(16, "big")
+    if _load_crypto_backend() == "cryptography":
+        cipher = Cipher(algorithms.AES(key), modes.CTR(counter)).encryptor()
+        return cipher.update(data) + cipher.finalize()
+    return AES.new(key, AES.MODE_CTR, nonce=b"", initial_value=counter).encrypt(data)
+
+@lru_cache(maxsize=1)
+def _cpu_executor() -> ThreadPoolExecutor:
+    """Shared pool for parallel cipher segments, separate from the per-file pools"""
+    return ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="crypto")
+
+@lru_cache(maxsize=1)
+def _io_executor() -> ThreadPoolExecutor:
+    """Pool reused by every organize run so its threads are started only once"""
+    return ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="fop-io")
+
+# Encrypt/decrypt file tasks wait on _cpu_executor segments, so they get their own
+# pool; sharing one would deadlock once every thread waits on a queued segment
+@lru_cache(maxsize=1)
+def _crypto_file_executor() -> ThreadPoolExecutor:
+    """Pool reused by every encrypt/decrypt run so its threads are started only once"""
+    return ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="fop-crypto-file")
+
+def _aes_ctr_crypt_stream(infile, outfile, key: bytes, nonce: bytes) -> None:
+    """AES-CTR transform the rest of infile into outfile, segments in parallel"""
+    executor = _cpu_executor()
+    # Keep one segment per worker in flight so memory stays bounded on large files
+    pending = deque()
+    block_offset = 0
+    while True:
+        segment = infile.read(CTR_SEGMENT_SIZE)
+        if not segment:
+            break
+        pending.append(executor.submit(_aes_ctr_transform, key, nonce, block_offset, segment))
+        block_offset += len(segment) // 16
+        
+        # Write the oldest segment as soon as the window is full, in order
+        if len(pending) >= CPU_WORKERS:
+            outfile.write(pending.popleft().result())
+    
+    while pending:
+        outfile.write(pending.popleft().result())
+
+def read_scaled_image(file_path: str, width: int, height: int, upscale: bool = True) -> QImage:
+    """Decode an image to fit width x height, as cheaply as its format allows"""
+    reader = QImageReader(file_path)
+    reader.setAutoTransform(True)
+    if not reader.canRead():
+        return QImage()
+    
+    original_size = reader.size()
+    if not original_size.isValid():
+        return reader.read()
+    if not upscale and original_size.width() <= width and original_size.height() <= height:
+        return reader.read()
+    target = original_size.scaled(width, height, Qt.KeepAspectRatio)
+    
+    # libjpeg scales in the DCT domain while decoding; other plugins decode every
+    # pixel and smooth-scale afterwards, so those get the two-stage rescale below
+    if reader.format() == b"jpeg":
+        reader.setScaledSize(target)
+        return reader.read()
+    
+    image = reader.read()
+    if image.isNull():
+        return image
+    # A fast nearest-neighbour pass to twice the target keeps the smooth pass cheap
+    # (target already has the image's aspect ratio, so it is applied exactly)
+    if image.width() > 4 * target.width() or image.height() > 4 * target.height():
+        image = image.scaled(target * 2, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+    return image.scaled(target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+@lru_cache(maxsize=256)
+def _icon_pixmap(ext: str, size: int, is_dir: bool = False) -> QPixmap:
+    """Rasterize the icon for an extension once per size"""
+    return FileIcons.get_file_icon("x" + ext, is_dir=is_dir).pixmap(size, size)
+
+def get_file_icon_pixmap(file_path: str, size: int, is_dir: Optional[bool] = None) -> QPixmap:
+    """Get a file's icon as a pixmap shared by every file with the same extension"""
+    if is_dir is None:
+        is_dir = os.path.isdir(file_path)
+    return _icon_pixmap("" if is_dir else get_file_extension(file_path), size, is_dir)
+
+def get_file_thumbnail(file_path: str, size: int = 64) -> QPixmap:
+    """Generate a thumbnail for a file"""
     # For images, try to load the actual image
     if get_file_category(file_path) == "Images":
         try:
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Check if we have a cached thumbnail (the mtime drops stale entries)
+            cache_key = (file_path, size, os.path.getmtime(file_path))
+            cached = FileIcons._thumbnail_cache.get(cache_key)
+            if cached is not None:
+                return cached.pixmap(size, size)
+            
+            image = read_scaled_image(file_path, size, size)
+            if not image.isNull():
+                scaled_pixmap = QPixmap.fromImage(image)
                 # Cache the thumbnail
-                FileIcons._icon_cache[cache_key] = QIcon(scaled_pixmap)
+                FileIcons._thumbnail_cache[cache_key] = QIcon(scaled_pixmap)
                 return scaled_pixmap
         except:
             pass
@@ -750,14 +1169,286 @@ def get_file_thumbnail(file_path: str, size: int = 64) -> QPixmap:
     # For videos, we could add video thumbnail generation here
     # This would require additional libraries like OpenCV
     
-    return default_pixmap
+    # Everything else shares the icon rendered for its extension
+    return get_file_icon_pixmap(file_path, size)
+
+class ThumbnailCache:
+    """Image thumbnails stored on disk so they survive re-layouts and restarts"""
+    # CUSTOMIZABLE: Size of the thumbnails kept on disk (the freedesktop "normal" size)
+    DISK_SIZE = 128
+    # CUSTOMIZABLE: Disk space the cache may use before the least recently used thumbnails are deleted
+    DISK_LIMIT = 256 * 1024 * 1024
+    # CUSTOMIZABLE: Thumbnails not used for this many days are deleted
+    DISK_MAX_AGE_DAYS = 90
+    _instance = None
+    # Tiles and previews first ask for the cache from several pool threads at once
+    _instance_lock = threading.Lock()
+    
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._dir_ready = False
+    
+    @classmethod
+    def instance(cls) -> "ThumbnailCache":
+        """Get the shared cache in the user's cache folder"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                # Another thread may have created it while this one waited
+                if cls._instance is None:
+                    base = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+                    if not base:
+                        base = os.path.join(get_user_home_dir(), ".cache")
+                    instance = cls(os.path.join(base, "file-organizer-pro", "thumbs", "normal"))
+                    # Trim the cache once per session, in the background
+                    _io_executor().submit(instance.prune)
+                    cls._instance = instance
+        return cls._instance
+    
+    def prune(self):
+        """Delete stale thumbnails, then the least recently used ones while over DISK_LIMIT"""
+        cutoff = time.time() - self.DISK_MAX_AGE_DAYS * 86400
+        kept = []
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        st = entry.stat()
+                        if st.st_mtime < cutoff:
+                            os.remove(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    kept.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        except OSError:
+            # No cache folder yet
+            return
+        
+        if total > self.DISK_LIMIT:
+            # Oldest first; a thumbnail's mtime is refreshed each time it is loaded
+            kept.sort()
+            for _, size, path in kept:
+                if total <= self.DISK_LIMIT:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+    
+    def _cache_path(self, file_path: str, st: os.stat_result) -> str:
+        """Cache file name for a file version, changing whenever it is modified"""
+        key = f"{os.path.abspath(file_path)}\0{st.st_mtime_ns}\0{st.st_size}"
+        return os.path.join(self.cache_dir, hashlib.blake2b(key.encode("utf-8", "surrogateescape"), digest_size=16).hexdigest() + ".png")
+    
+    def get(self, file_path: str, size: int = 64) -> QPixmap:
+        """Get a thumbnail, decoding the image only if it is not cached yet"""
+        if get_file_category(file_path) != "Images":
+            return get_file_thumbnail(file_path, size)
+        
+        pixmap = self.cached_pixmap(file_path, size)
+        if pixmap is not None:
+            return pixmap
+        
+        key, image = self.load_image(file_path, size)
+        if key is None:
+            return get_file_thumbnail(file_path, size)
+        return self.remember(key, image)
+    
+    def cached_pixmap(self, file_path: str, size: int = 64) -> Optional[QPixmap]:
+        """Get a thumbnail already shown this session, without touching the disk cache"""
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            return None
+        cached = FileIcons._thumbnail_cache.get((file_path, size, mtime))
+        return cached.pixmap(size, size) if cached is not None else None
+    
+    def load_image(self, file_path: str, size: int = 64) -> Tuple[Optional[tuple], QImage]:
+        """Load a thumbnail from disk or decode it (safe off the GUI thread, no QPixmap)"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None, QImage()
+        
+        cache_path = self._cache_path(file_path, st)
+        image = QImage()
+        if image.load(cache_path, "PNG"):
+            # Mark it as recently used so pruning deletes other thumbnails first
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+        else:
+            image = self._render(file_path)
+            if image.isNull():
+                return None, image
+            self._store(image, cache_path)
+        
+        if image.width() > size or image.height() > size:
+            image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return (file_path, size, st.st_mtime), image
+    
+    def remember(self, key: tuple, image: QImage) -> QPixmap:
+        """Turn a loaded thumbnail into a pixmap and keep it for this session (GUI thread)"""
+        pixmap = QPixmap.fromImage(image)
+        FileIcons._thumbnail_cache[key] = QIcon(pixmap)
+        return pixmap
+    
+    def _render(self, file_path: str) -> QImage:
+        """Decode an image straight to the on-disk thumbnail size"""
+        return read_scaled_image(file_path, self.DISK_SIZE, self.DISK_SIZE, upscale=False)
+    
+    def _store(self, image: QImage, cache_path: str):
+        """Write a thumbnail atomically so concurrent sessions never see half a file"""
+        try:
+            if not self._dir_ready:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                self._dir_ready = True
+            temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            if image.save(temp_path, "PNG"):
+                os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.error(f"Error saving thumbnail cache: {str(e)}")
+
+class _ThumbnailSignals(QObject):
+    """Signals for ThumbnailTask (a QRunnable cannot emit signals itself)"""
+    done = pyqtSignal(object, QImage)  # memory cache key, thumbnail image
+
+class ThumbnailTask(QRunnable):
+    """Loads a tile thumbnail on a QThreadPool thread"""
+    def __init__(self, file_path: str, size: int, is_current: Optional[Callable[[], bool]] = None):
+        super().__init__()
+        self.file_path = file_path
+        self.size = size
+        self.is_current = is_current
+        self.signals = _ThumbnailSignals()
+    
+    def run(self):
+        # Tiles from an earlier layout are gone, do not decode for them
+        if self.is_current is not None and not self.is_current():
+            return
+        try:
+            key, image = ThumbnailCache.instance().load_image(self.file_path, self.size)
+        except Exception as e:
+            logger.error(f"Error loading thumbnail for {self.file_path}: {str(e)}")
+            return
+        if key is not None:
+            self.signals.done.emit(key, image)
+
+class _PreviewSignals(QObject):
+    """Signals for PreviewTask"""
+    ready = pyqtSignal(int, object, QImage)  # request generation, cache key, scaled image
+
+class PreviewTask(QRunnable):
+    """Decodes a preview image at the preview size on a QThreadPool thread"""
+    def __init__(self, generation: int, key, file_path: str, width: int, height: int,
+                 is_current: Optional[Callable[[], bool]] = None):
+        super().__init__()
+        self.generation = generation
+        self.key = key
+        self.file_path = file_path
+        self.width = width
+        self.height = height
+        self.is_current = is_current
+        self.signals = _PreviewSignals()
+    
+    def run(self):
+        # The user has already moved on to another file
+        if self.is_current is not None and not self.is_current():
+            return
+        try:
+            image = read_scaled_image(self.file_path, self.width, self.height)
+        except Exception as e:
+            logger.error(f"Error loading preview for {self.file_path}: {str(e)}")
+            image = QImage()
+        self.signals.ready.emit(self.generation, self.key, image)
 
+class _FolderSummarySignals(QObject):
+    """Signals for FolderSummaryTask"""
+    ready = pyqtSignal(int, str, object)  # request generation, folder, (files, folders, size) or None
+
+class FolderSummaryTask(QRunnable):
+    """Counts a folder's contents and size on a QThreadPool thread"""
+    def __init__(self, generation: int, path: str, is_current: Optional[Callable[[], bool]] = None):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.is_current = is_current
+        self.signals = _FolderSummarySignals()
+    
+    def run(self):
+        # The user has already moved on to another file
+        if self.is_current is not None and not self.is_current():
+            return
+        try:
+            summary = get_directory_summary(self.path)
+        except Exception as e:
+            logger.error(f"Error reading folder {self.path}: {str(e)}")
+            summary = None
+        self.signals.ready.emit(self.generation, self.path, summary)
+
+class _DirectoryScanSignals(QObject):
+    """Signals for DirectoryScanTask"""
+    batch = pyqtSignal(int, list)  # scan generation, os.DirEntry objects
+    done = pyqtSignal(int, str, str)  # scan generation, folder, error message ("" on success)
+
+class DirectoryScanTask(QRunnable):
+    """Lists a folder on a QThreadPool thread and hands the entries over in batches"""
+    def __init__(self, generation: int, path: str, is_current: Optional[Callable[[], bool]] = None):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.is_current = is_current
+        self.signals = _DirectoryScanSignals()
+    
+    def run(self):
+        error = ""
+        try:
+            batch = []
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    # Read the type here so the GUI thread only sees the cached value
+                    try:
+                        entry.is_dir()
+                    except OSError:
+                        pass
+                    batch.append(entry)
+                    if len(batch) >= DIRECTORY_SCAN_BATCH:
+                        # The user has already moved on to another folder
+                        if self.is_current is not None and not self.is_current():
+                            return
+                        self.signals.batch.emit(self.generation, batch)
+                        batch = []
+            if batch:
+                self.signals.batch.emit(self.generation, batch)
+        except Exception as e:
+            logger.error(f"Error reading directory {self.path}: {str(e)}")
+            error = str(e)
+        self.signals.done.emit(self.generation, self.path, error)
+
+@lru_cache(maxsize=1)
 def get_user_home_dir() -> str:
-    """Get the user's home directory"""
+    """Get the user's home directory (resolved once per session)"""
+    # expanduser falls back to a passwd lookup when HOME/USERPROFILE is unset,
+    # which can be slow on network user databases
     return os.path.expanduser("~")
 
+@lru_cache(maxsize=1)
+def get_trash_function() -> Optional[Callable[[str], None]]:
+    """Return send2trash when deletes go to the trash and it is installed, else None"""
+    if not DELETE_TO_TRASH:
+        return None
+    try:
+        from send2trash import send2trash
+    except ImportError:
+        return None
+    return send2trash
+
 def open_file(file_path: str) -> bool:
     """Open a file with the default application"""
+    import subprocess  # Only needed when a file is actually opened
     try:
         if sys.platform == 'win32':
             os.startfile(file_path)
@@ -770,12 +1461,43 @@ def open_file(file_path: str) -> bool:
         logger.error(f"Error opening file {file_path}: {str(e)}")
         return False
 
+def _win_reveal_in_explorer(file_path: str) -> bool:
+    """Select a file in an Explorer window through the shell API (Windows only)"""
+    import ctypes
+    from ctypes import wintypes
+    try:
+        shell32 = ctypes.windll.shell32
+        shell32.ILCreateFromPathW.argtypes = [wintypes.LPCWSTR]
+        shell32.ILCreateFromPathW.restype = ctypes.c_void_p
+        shell32.ILFree.argtypes = [ctypes.c_void_p]
+        shell32.SHOpenFolderAndSelectItems.argtypes = [
+            ctypes.c_void_p, wintypes.UINT, ctypes.c_void_p, wintypes.DWORD
+        ]
+        shell32.SHOpenFolderAndSelectItems.restype = ctypes.c_long
+        
+        # The shell API needs COM on this thread (no-op if already initialized)
+        ctypes.windll.ole32.CoInitialize(None)
+        
+        pidl = shell32.ILCreateFromPathW(os.path.normpath(os.path.abspath(file_path)))
+        if not pidl:
+            return False
+        try:
+            return shell32.SHOpenFolderAndSelectItems(pidl, 0, None, 0) == 0
+        finally:
+            shell32.ILFree(pidl)
+    except (OSError, AttributeError) as e:
+        logger.warning(f"Shell reveal failed for {file_path}: {str(e)}")
+        return False
+
 def open_file_location(file_path: str) -> bool:
     """Open the containing folder of a file"""
+    import subprocess  # Only needed when a location is actually opened
     try:
         folder_path = os.path.dirname(file_path)
         if sys.platform == 'win32':
-            subprocess.Popen(f'explorer /select,"{file_path}"')
+            # Reuse the running Explorer instead of starting a new explorer.exe
+            if not _win_reveal_in_explorer(file_path):
+                subprocess.Popen(f'explorer /select,"{file_path}"')
         elif sys.platform == 'darwin':  # macOS
             subprocess.call(['open', folder_path])
         else:  # Linux
@@ -785,18 +1507,200 @@ def open_file_location(file_path: str) -> bool:
         logger.error(f"Error opening file location {file_path}: {str(e)}")
         return False
 
+def _scan_directory_size(path: str) -> int:
+    """Sum the file sizes below one directory on the calling thread"""
+    total_size = 0
+    # scandir entries carry their type (and cache their stat), so each file
+    # costs at most one stat call and no path joining
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        # Like os.walk, symlinked folders are not followed; symlinked
+                        # files count with their target's size, broken links not at all
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                stack.append(entry.path)
+                        else:
+                            total_size += entry.stat().st_size
+                    except OSError:
+                        pass
+        except OSError:
+            # Unreadable folders are skipped, like os.walk does
+            pass
+    return total_size
+
+def get_directory_summary(path: str) -> Tuple[int, int, int]:
+    """Count the files and folders in a directory and total its size (raises OSError)"""
+    num_files = num_dirs = total_size = 0
+    subdirs = []
+    # One scandir pass gives the counts, the top-level sizes and the subtrees to size
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    num_dirs += 1
+                    # Symlinked folders are counted but not followed
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.is_file():
+                    # Broken symlinks are neither files nor folders
+                    total_size += entry.stat().st_size
+                    num_files += 1
+            except OSError:
+                pass
+    
+    # Walk the top-level subtrees concurrently to overlap directory reads
+    if len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(subdirs))) as executor:
+            total_size += sum(executor.map(_scan_directory_size, subdirs))
+    elif subdirs:
+        total_size += _scan_directory_size(subdirs[0])
+    return num_files, num_dirs, total_size
+
 def get_directory_size(path: str) -> int:
     """Calculate the total size of a directory"""
-    total_size = 0
     try:
-        for dirpath, dirnames, filenames in os.walk(path):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                if os.path.exists(fp):
-                    total_size += os.path.getsize(fp)
+        return get_directory_summary(path)[2]
     except Exception as e:
         logger.error(f"Error calculating directory size: {str(e)}")
-    return total_size
+        return 0
+
+def _advise_sequential(fd: int) -> None:
+    """Tell the kernel a file will be read once from start to end (POSIX only)"""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def _advise_dontneed(fd: int, size: int) -> None:
+    """Let the kernel drop a large written-once file from the page cache (POSIX only)"""
+    # Dirty pages cannot be dropped, so the file is written back first; waiting
+    # for that only pays off for outputs big enough to evict other files
+    if size >= DROP_CACHE_MIN_SIZE and hasattr(os, "posix_fadvise"):
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve disk space for a large output so extending writes skip allocation"""
+    if size >= PREALLOCATE_MIN_SIZE and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass
+
+def _is_zip_archive(file_path: str) -> bool:
+    """Check whether a file is a zip archive (how encrypted folders are stored)"""
+    import zipfile
+    try:
+        with open(file_path, 'rb') as f:
+            # Encrypted files start with a header or a random salt, never a zip signature
+            if f.read(4) not in (b"PK\x03\x04", b"PK\x05\x06"):
+                return False
+    except OSError:
+        return False
+    return zipfile.is_zipfile(file_path)
+
+@lru_cache(maxsize=None)
+def _clonefile_function():
+    """Return macOS clonefile(2), or None where it is not available"""
+    if sys.platform != "darwin":
+        return None
+    import ctypes
+    try:
+        clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy a file with its metadata, letting the kernel move the bytes on Linux"""
+    if not sys.platform.startswith("linux"):
+        # On APFS a clone shares the source's blocks, so it takes no time whatever
+        # the size; other volumes, or an existing destination, get a normal copy
+        clonefile = _clonefile_function()
+        if clonefile is not None and clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return
+        shutil.copy2(src, dst)
+        return
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd = fsrc.fileno()
+        out_fd = fdst.fileno()
+        _advise_sequential(in_fd)
+        # copy_file_range can reflink on CoW filesystems; sendfile works across
+        # devices; both avoid bouncing the data through user space
+        use_copy_file_range = hasattr(os, "copy_file_range")
+        while True:
+            try:
+                if use_copy_file_range:
+                    copied = os.copy_file_range(in_fd, out_fd, 1 << 30)
+                else:
+                    copied = os.sendfile(out_fd, in_fd, None, 1 << 30)
+            except OSError as e:
+                if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                    raise
+                if use_copy_file_range:
+                    use_copy_file_range = False
+                    continue
+                # Neither syscall works here, finish with a plain buffered copy
+                shutil.copyfileobj(fsrc, fdst, BUFFER_SIZE)
+                break
+            if copied == 0:
+                break
+        
+        # Organized copies are written once, keep them from evicting useful pages
+        fdst.flush()
+        _advise_dontneed(out_fd, os.fstat(out_fd).st_size)
+    
+    shutil.copystat(src, dst)
+
+class _SignalThrottle:
+    """Coalesces a worker's progress and status signals so the GUI thread is not flooded"""
+    def __init__(self, progress_signal, status_signal):
+        self._progress_signal = progress_signal
+        self._status_signal = status_signal
+        self._lock = threading.Lock()
+        self._last_count = 0
+        self._last_progress_time = 0.0
+        self._last_status_time = 0.0
+        self._pending_status = None
+    
+    def progress(self, processed: int, total: int, force: bool = False):
+        """Emit progress every PROGRESS_EMIT_EVERY files or PROGRESS_EMIT_INTERVAL seconds"""
+        now = time.monotonic()
+        if (force or processed - self._last_count >= PROGRESS_EMIT_EVERY
+                or now - self._last_progress_time >= PROGRESS_EMIT_INTERVAL):
+            self._last_count = processed
+            self._last_progress_time = now
+            self._progress_signal.emit(processed, total)
+    
+    def status(self, text: str, force: bool = False):
+        """Emit a status message, keeping only the latest one within an interval"""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_status_time < PROGRESS_EMIT_INTERVAL:
+                self._pending_status = text
+                return
+            self._last_status_time = now
+            self._pending_status = None
+        self._status_signal.emit(text)
+    
+    def flush(self, processed: int, total: int):
+        """Emit the last held back status message and the final progress"""
+        with self._lock:
+            text, self._pending_status = self._pending_status, None
+        if text is not None:
+            self._status_signal.emit(text)
+        self.progress(processed, total, force=True)
 
 # Worker threads for background operations
 class FileOrganizerWorker(QThread):
@@ -807,7 +1711,7 @@ class FileOrganizerWorker(QThread):
     file_processed = pyqtSignal(str, str)  # source, destination
     
     def __init__(self, 
-                 files: List[str], 
+                 files: List[Union[str, os.DirEntry]], 
                  destination: str, 
                  organize_by: str,
                  remove_originals: bool = False):
@@ -817,13 +1721,20 @@ class FileOrganizerWorker(QThread):
         self.organize_by = organize_by  # "type", "date", or "both"
         self.remove_originals = remove_originals
         self.is_cancelled = False
+        # Names already present or reserved in each destination folder
+        self._folder_names: Dict[str, Set[str]] = {}
+        self._names_lock = threading.Lock()
+        # Destination folders already created by this run
+        self._created_dirs: Set[str] = set()
+        self._dirs_lock = threading.Lock()
+        self._signals = _SignalThrottle(self.progress_updated, self.status_updated)
     
     def run(self):
         try:
             total_files = len(self.files)
-            processed = 0
             
             # Create main organization folders
+            type_folder = date_folder = None
             if self.organize_by == "type" or self.organize_by == "both":
                 type_folder = os.path.join(self.destination, "Organized by Type")
                 os.makedirs(type_folder, exist_ok=True)
@@ -832,46 +1743,53 @@ class FileOrganizerWorker(QThread):
                 date_folder = os.path.join(self.destination, "Organized by Date")
                 os.makedirs(date_folder, exist_ok=True)
             
-            # Use ThreadPoolExecutor for parallel processing
-            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                # Create a list to store futures
-                futures = []
+            # Skip directories up front; DirEntry items answer from their cached type
+            file_paths = []
+            for item in self.files:
+                if isinstance(item, os.DirEntry):
+                    if not item.is_dir():
+                        file_paths.append(item.path)
+                elif not os.path.isdir(item):
+                    file_paths.append(item)
+            
+            processed = total_files - len(file_paths)
+            if processed:
+                self._signals.progress(processed, total_files)
+            
+            # The pool outlives this run so its threads are not started again next time
+            executor = _io_executor()
+            # Submit files in batches so per-task overhead is paid once per batch
+            futures = [
+                executor.submit(self._process_batch, file_paths[i:i + ORGANIZE_BATCH_SIZE], type_folder, date_folder)
+                for i in range(0, len(file_paths), ORGANIZE_BATCH_SIZE)
+            ]
+            
+            # Process results in completion order so one large file does not stall progress
+            for future in as_completed(futures):
+                if self.is_cancelled:
+                    break
                 
-                for file_path in self.files:
-                    if self.is_cancelled:
-                        break
-                    
-                    # Skip directories
-                    if os.path.isdir(file_path):
-                        processed += 1
-                        self.progress_updated.emit(processed, total_files)
-                        continue
-                    
-                    # Submit task to executor
-                    future = executor.submit(
-                        self._process_file, 
-                        file_path, 
-                        type_folder if self.organize_by in ["type", "both"] else None,
-                        date_folder if self.organize_by in ["date", "both"] else None
-                    )
-                    futures.append(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.error(f"Error in worker thread: {str(e)}")
+                    continue
                 
-                # Process results as they complete
-                for i, future in enumerate(futures):
-                    if self.is_cancelled:
-                        break
-                    
-                    try:
-                        result = future.result()
-                        if result:
-                            source, dest = result
-                            self.file_processed.emit(source, dest)
-                    except Exception as e:
-                        logger.error(f"Error in worker thread: {str(e)}")
+                for result in results:
+                    if result:
+                        source, dest = result
+                        self.file_processed.emit(source, dest)
                     
                     processed += 1
-                    self.progress_updated.emit(processed, total_files)
+                    self._signals.progress(processed, total_files)
+            
+            if self.is_cancelled:
+                # Drop queued tasks from the shared pool and let running ones finish
+                for future in futures:
+                    future.cancel()
+                wait(futures)
             
+            self._signals.flush(processed, total_files)
             if self.is_cancelled:
                 self.operation_completed.emit(False, "Operation cancelled")
             else:
@@ -881,6 +1799,43 @@ class FileOrganizerWorker(QThread):
             logger.error(f"Organization error: {str(e)}")
             self.operation_completed.emit(False, f"Error: {str(e)}")
     
+    def _ensure_dir(self, folder: str):
+        """Create a destination folder once per run"""
+        with self._dirs_lock:
+            # Creating under the lock keeps other threads from copying into it early
+            if folder not in self._created_dirs:
+                os.makedirs(folder, exist_ok=True)
+                self._created_dirs.add(folder)
+    
+    def _reserve_destination(self, folder: str, filename: str) -> str:
+        """Pick a free file name in folder, resolving duplicates in memory"""
+        # Windows and macOS file systems are case-insensitive by default
+        fold = str.lower if sys.platform in ("win32", "darwin") else str
+        with self._names_lock:
+            names = self._folder_names.get(folder)
+            if names is None:
+                names = {fold(n) for n in os.listdir(folder)}
+                self._folder_names[folder] = names
+            
+            # Handle duplicate filenames
+            new_filename = filename
+            counter = 1
+            name, ext = os.path.splitext(filename)
+            while fold(new_filename) in names:
+                new_filename = f"{name}_{counter}{ext}"
+                counter += 1
+            names.add(fold(new_filename))
+        return os.path.join(folder, new_filename)
+    
+    def _process_batch(self, file_paths, type_folder, date_folder):
+        """Process a batch of files in one worker thread, stopping early on cancel"""
+        results = []
+        for file_path in file_paths:
+            if self.is_cancelled:
+                break
+            results.append(self._process_file(file_path, type_folder, date_folder))
+        return results
+    
     def _process_file(self, file_path, type_folder, date_folder):
         """Process a single file (to be run in a worker thread)"""
         try:
@@ -891,21 +1846,13 @@ class FileOrganizerWorker(QThread):
             if type_folder:
                 category = get_file_category(file_path)
                 category_folder = os.path.join(type_folder, category)
-                os.makedirs(category_folder, exist_ok=True)
+                self._ensure_dir(category_folder)
                 
-                dest_path = os.path.join(category_folder, filename)
-                
-                # Handle duplicate filenames
-                counter = 1
-                name, ext = os.path.splitext(filename)
-                while os.path.exists(dest_path):
-                    new_filename = f"{name}_{counter}{ext}"
-                    dest_path = os.path.join(category_folder, new_filename)
-                    counter += 1
+                dest_path = self._reserve_destination(category_folder, filename)
                 
                 # Copy the file
-                shutil.copy2(file_path, dest_path)
-                self.status_updated.emit(f"Copied to Type: {filename}")
+                _fast_copy(file_path, dest_path)
+                self._signals.status(f"Copied to Type: {filename}")
             
             # Process by date
             if date_folder:
@@ -913,32 +1860,35 @@ class FileOrganizerWorker(QThread):
                 # Use yyyy-mm-dd format
                 date_subfolder = date.strftime("%Y-%m-%d")
                 day_folder = os.path.join(date_folder, date_subfolder)
-                os.makedirs(day_folder, exist_ok=True)
+                self._ensure_dir(day_folder)
                 
-                dest_path = os.path.join(day_folder, filename)
+                type_dest_path = dest_path
+                dest_path = self._reserve_destination(day_folder, filename)
                 
-                # Handle duplicate filenames
-                counter = 1
-                name, ext = os.path.splitext(filename)
-                while os.path.exists(dest_path):
-                    new_filename = f"{name}_{counter}{ext}"
-                    dest_path = os.path.join(day_folder, new_filename)
-                    counter += 1
+                # Link to the type copy when there is one, copy if links are not possible
+                linked = False
+                if type_dest_path and ORGANIZE_HARDLINK_BOTH:
+                    try:
+                        os.link(type_dest_path, dest_path)
+                        linked = True
+                    except OSError:
+                        pass
                 
                 # Copy the file
-                shutil.copy2(file_path, dest_path)
-                self.status_updated.emit(f"Copied to Date: {filename}")
+                if not linked:
+                    _fast_copy(file_path, dest_path)
+                self._signals.status(f"Copied to Date: {filename}")
             
             # Remove original if requested
             if self.remove_originals:
                 os.remove(file_path)
-                self.status_updated.emit(f"Removed original: {filename}")
+                self._signals.status(f"Removed original: {filename}")
             
             return (file_path, dest_path)
             
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {str(e)}")
-            self.status_updated.emit(f"Error: {filename} - {str(e)}")
+            self._signals.status(f"Error: {filename} - {str(e)}", force=True)
             return None
     
     def cancel(self):
@@ -962,44 +1912,56 @@ class EncryptionWorker(QThread):
         self.operation = operation
         self.remove_originals = remove_originals
         self.is_cancelled = False
+        # Encryption key and salt shared by every file of this run
+        self._master_key = None
+        self._master_salt = None
+        self._key_lock = threading.Lock()
+        self._signals = _SignalThrottle(self.progress_updated, self.status_updated)
     
     def run(self):
         try:
             total_files = len(self.files)
             processed = 0
             
-            # Use ThreadPoolExecutor for parallel processing
-            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                # Create a list to store futures
-                futures = []
+            # The pool outlives this run so its threads are not started again next time
+            executor = _crypto_file_executor()
+            # Create a list to store futures
+            futures = []
+            
+            for file_path in self.files:
+                if self.is_cancelled:
+                    break
                 
-                for file_path in self.files:
-                    if self.is_cancelled:
-                        break
-                    
-                    # Submit task to executor
-                    future = executor.submit(
-                        self._process_file, 
-                        file_path
-                    )
-                    futures.append(future)
+                # Submit task to executor
+                future = executor.submit(
+                    self._process_file, 
+                    file_path
+                )
+                futures.append(future)
+            
+            # Process results in completion order so one large file does not stall progress
+            for future in as_completed(futures):
+                if self.is_cancelled:
+                    break
                 
-                # Process results as they complete
-                for i, future in enumerate(futures):
-                    if self.is_cancelled:
-                        break
-                    
-                    try:
-                        result = future.result()
-                        if result:
-                            source, dest = result
-                            self.file_processed.emit(source, dest)
-                    except Exception as e:
-                        logger.error(f"Error in worker thread: {str(e)}")
-                    
-                    processed += 1
-                    self.progress_updated.emit(processed, total_files)
+                try:
+                    result = future.result()
+                    if result:
+                        source, dest = result
+                        self.file_processed.emit(source, dest)
+                except Exception as e:
+                    logger.error(f"Error in worker thread: {str(e)}")
+                
+                processed += 1
+                self._signals.progress(processed, total_files)
+            
+            if self.is_cancelled:
+                # Drop queued tasks from the shared pool and let running ones finish
+                for future in futures:
+                    future.cancel()
+                wait(futures)
             
+            self._signals.flush(processed, total_files)
             if self.is_cancelled:
                 self.operation_completed.emit(False, "Operation cancelled")
             else:
@@ -1013,7 +1975,7 @@ class EncryptionWorker(QThread):
         """Process a single file or directory (to be run in a worker thread)"""
         try:
             filename = os.path.basename(file_path)
-            self.status_updated.emit(f"{self.operation.capitalize()}ing: {filename}")
+            self._signals.status(f"{self.operation.capitalize()}ing: {filename}")
             
             # Handle directories
             if os.path.isdir(file_path):
@@ -1062,6 +2024,9 @@ class EncryptionWorker(QThread):
                 # Process the file
                 if self.operation == "encrypt":
                     self._encrypt_file(file_path, output_path)
+                elif _is_zip_archive(file_path):
+                    # Encrypted folders are stored as a zip of encrypted files
+                    self._decrypt_directory(file_path, output_path)
                 else:
                     self._decrypt_file(file_path, output_path)
             
@@ -1076,166 +2041,411 @@ class EncryptionWorker(QThread):
             
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {str(e)}")
-            self.status_updated.emit(f"Error: {filename} - {str(e)}")
+            self._signals.status(f"Error: {filename} - {str(e)}", force=True)
             return None
     
+    def _run_key(self) -> Tuple[bytes, bytes]:
+        """Derive the key for this run once, with a fresh random salt"""
+        with self._key_lock:
+            if self._master_key is None:
+                self._master_key, self._master_salt = derive_key_from_password(self.password)
+            return self._master_key, self._master_salt
+    
     def _encrypt_file(self, input_path: str, output_path: str):
         """Encrypt a file using AES-256"""
-        # Generate a random salt
-        salt = get_random_bytes(16)
-        # Derive key from password
-        key, _ = derive_key_from_password(self.password, salt)
+        with open(input_path, 'rb') as infile:
+            size = os.fstat(infile.fileno()).st_size
+            _advise_sequential(infile.fileno())
+            
+            # Files that fit comfortably in a 64-bit address space skip the chunk loop
+            if ENCRYPTION_MODE == "gcm" and 0 < size < MMAP_MAX_SIZE and sys.maxsize > 2 ** 32:
+                self._encrypt_file_mmap(infile, output_path, size)
+                return
+            
+            with open(output_path, 'wb') as outfile:
+                _preallocate(outfile.fileno(), self._encrypted_size(size))
+                self._encrypt_stream(infile, outfile)
+                
+                # Cut off any preallocated space left over if the input shrank while it was read
+                outfile.flush()
+                written = outfile.tell()
+                os.ftruncate(outfile.fileno(), written)
+                _advise_dontneed(outfile.fileno(), written)
+    
+    def _encrypt_file_mmap(self, infile, output_path: str, size: int):
+        """AES-GCM encrypt a whole file in one call between memory maps"""
+        key, salt = self._run_key()
+        nonce = get_random_bytes(12)
+        encryptor = _AESGCMEncryptor(key, nonce)
+        
+        # Header: magic, mode byte, salt, nonce, then the tag once it is known
+        header = ENCRYPTED_MAGIC + bytes([ENCRYPTION_MODE_IDS["gcm"]]) + salt + nonce
+        body_offset = len(header) + 16
+        out_size = self._encrypted_size(size)
+        
+        with open(output_path, 'w+b') as outfile:
+            # Older cryptography releases want one block of headroom for update_into,
+            # so the map gets 15 spare bytes that are truncated away afterwards
+            outfile.truncate(out_size + 15)
+            with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm_in, \
+                    mmap.mmap(outfile.fileno(), out_size + 15, access=mmap.ACCESS_WRITE) as mm_out:
+                with memoryview(mm_in) as src, memoryview(mm_out) as dst:
+                    dst[:len(header)] = header
+                    encryptor.update_into(src, dst[body_offset:])
+                    dst[len(header):body_offset] = encryptor.finalize()
+                mm_out.flush()
+            outfile.truncate(out_size)
+            _advise_dontneed(outfile.fileno(), out_size)
+    
+    @staticmethod
+    def _encrypted_size(size: int) -> int:
+        """Exact size of an encrypted file written by _encrypt_file for size plaintext bytes"""
+        header = len(ENCRYPTED_MAGIC) + 1 + 16
+        if ENCRYPTION_MODE == "gcm":
+            return header + 12 + 16 + size
+        if ENCRYPTION_MODE == "ctr":
+            return header + 16 + 8 + size
+        # Legacy CBC: salt, IV, then PKCS#7 always adds 1-16 bytes
+        return 32 + (size // 16 + 1) * 16
+    
+    def _encrypt_stream(self, infile, outfile):
+        """Encrypt everything read from infile into outfile using AES-256"""
+        # The salt is still written into every file, only the PBKDF2 run is shared
+        key, salt = self._run_key()
+        
+        if ENCRYPTION_MODE == "gcm":
+            # Generate a random nonce (GCM uses 96 bits)
+            nonce = get_random_bytes(12)
+            encryptor = _AESGCMEncryptor(key, nonce)
+            # The tag is only known at the end, streams that cannot seek get it appended
+            in_header = outfile.seekable()
+            
+            # Header: magic, mode byte, salt, nonce, tag
+            outfile.write(ENCRYPTED_MAGIC + bytes([ENCRYPTION_MODE_IDS["gcm" if in_header else "gcm-stream"]]))
+            outfile.write(salt)
+            outfile.write(nonce)
+            if in_header:
+                # Reserve the tag slot for now
+                tag_offset = outfile.tell()
+                outfile.write(bytes(16))
+            
+            # Process file in chunks
+            _gcm_crypt_stream(infile, outfile, encryptor)
+            
+            if in_header:
+                # Return to the end of the data afterwards, callers take the
+                # file's length from the stream position
+                end_offset = outfile.tell()
+                outfile.seek(tag_offset)
+                outfile.write(encryptor.finalize())
+                outfile.seek(end_offset)
+            else:
+                outfile.write(encryptor.finalize())
+            return
+        
         # Generate a random IV (initialization vector)
         iv = get_random_bytes(16)
-        # Create cipher
-        cipher = AES.new(key, AES.MODE_CBC, iv)
         
-        with open(input_path, 'rb') as infile, open(output_path, 'wb') as outfile:
-            # Write salt and IV to the output file
+        if ENCRYPTION_MODE == "ctr":
+            # Header: magic, mode byte, salt, nonce, key check
+            outfile.write(ENCRYPTED_MAGIC + bytes([ENCRYPTION_MODE_IDS["ctr"]]))
             outfile.write(salt)
             outfile.write(iv)
+            outfile.write(_key_check_value(key))
+            _aes_ctr_crypt_stream(infile, outfile, key, iv)
+            return
+        
+        # Create a streaming cipher kept alive across the whole file
+        encryptor = _AESCBCEncryptor(key, iv)
+        
+        # Write salt and IV to the output file
+        outfile.write(salt)
+        outfile.write(iv)
+        
+        # Process file in chunks
+        while True:
+            chunk = infile.read(BUFFER_SIZE)
+            if len(chunk) == 0:
+                break
             
-            # Process file in chunks
-            while True:
-                chunk = infile.read(BUFFER_SIZE)
-                if len(chunk) == 0:
-                    break
-                
-                # If this is the last chunk, pad it
-                if len(chunk) % 16 != 0:
-                    chunk = pad(chunk, 16)
-                
-                # Encrypt and write the chunk
-                encrypted_chunk = cipher.encrypt(chunk)
-                outfile.write(encrypted_chunk)
+            # Encrypt and write the chunk
+            outfile.write(encryptor.update(chunk))
+        
+        # Pad and write the final block
+        outfile.write(encryptor.finalize())
     
     def _decrypt_file(self, input_path: str, output_path: str):
         """Decrypt a file using AES-256"""
         with open(input_path, 'rb') as infile:
-            # Read salt and IV from the file
+            self._decrypt_stream(infile, output_path)
+    
+    def _decrypt_stream(self, infile, output_path: str):
+        """Decrypt everything read from infile into output_path using AES-256"""
+        # Files with a header carry their cipher mode, older files are plain CBC
+        header = infile.read(len(ENCRYPTED_MAGIC) + 1)
+        mode_id = header[-1] if header[:len(ENCRYPTED_MAGIC)] == ENCRYPTED_MAGIC else None
+        
+        if mode_id == ENCRYPTION_MODE_IDS["gcm"]:
             salt = infile.read(16)
-            iv = infile.read(16)
-            
-            # Derive key from password and salt
+            nonce = infile.read(12)
+            tag = infile.read(16)
             key, _ = derive_key_from_password(self.password, salt)
+            decryptor = _AESGCMDecryptor(key, nonce, tag)
             
-            # Create cipher
-            cipher = AES.new(key, AES.MODE_CBC, iv)
-            
-            # Read all encrypted data
-            encrypted_data = infile.read()
+            try:
+                with open(output_path, 'wb') as outfile:
+                    _gcm_crypt_stream(infile, outfile, decryptor)
+                    decryptor.finalize()
+            except ValueError:
+                # Never leave unauthenticated plaintext behind
+                os.remove(output_path)
+                raise ValueError("Incorrect password or corrupted file")
+            return
+        
+        if mode_id == ENCRYPTION_MODE_IDS["gcm-stream"]:
+            salt = infile.read(16)
+            nonce = infile.read(12)
+            key, _ = derive_key_from_password(self.password, salt)
+            decryptor = _AESGCMDecryptor(key, nonce)
             
-            # Decrypt the data
             try:
-                decrypted_data = cipher.decrypt(encrypted_data)
-                # Unpad the data
-                decrypted_data = unpad(decrypted_data, 16)
-                
-                # Write decrypted data to output file
                 with open(output_path, 'wb') as outfile:
-                    outfile.write(decrypted_data)
-            except ValueError as e:
-                # If unpadding fails, it might not be properly encrypted
-                raise ValueError("Invalid padding or incorrect password")
-    
+                    # The last 16 bytes are the tag, keep them back from the cipher
+                    pending = b""
+                    while True:
+                        chunk = infile.read(BUFFER_SIZE)
+                        if len(chunk) == 0:
+                            break
+                        data = pending + chunk
+                        pending = data[-16:]
+                        outfile.write(decryptor.update(data[:-16]))
+                    decryptor.finalize(pending)
+            except ValueError:
+                # Never leave unauthenticated plaintext behind
+                os.remove(output_path)
+                raise ValueError("Incorrect password or corrupted file")
+            return
+        
+        if mode_id == ENCRYPTION_MODE_IDS["ctr"]:
+            salt = infile.read(16)
+            nonce = infile.read(16)
+            key, _ = derive_key_from_password(self.password, salt)
+            if not hmac.compare_digest(infile.read(8), _key_check_value(key)):
+                raise ValueError("Incorrect password")
+            
+            with open(output_path, 'wb') as outfile:
+                _aes_ctr_crypt_stream(infile, outfile, key, nonce)
+            return
+        
+        # Read salt and IV from the file, the bytes read as a header start the salt
+        salt = header + infile.read(16 - len(header))
+        iv = infile.read(16)
+        
+        # Derive key from password and salt
+        key, _ = derive_key_from_password(self.password, salt)
+        
+        # Create cipher
+        decryptor = _AESCBCDecryptor(key, iv)
+        
+        # Decrypt the data chunk by chunk, the decryptor holds back the padded tail
+        try:
+            with open(output_path, 'wb') as outfile:
+                while True:
+                    chunk = infile.read(BUFFER_SIZE)
+                    if len(chunk) == 0:
+                        break
+                    outfile.write(decryptor.update(chunk))
+                
+                # Finalizing also removes the padding
+                outfile.write(decryptor.finalize())
+        except ValueError as e:
+            # If unpadding fails, it might not be properly encrypted
+            os.remove(output_path)
+            raise ValueError("Invalid padding or incorrect password")
+
     def _encrypt_directory(self, input_dir: str, output_path: str):
         """Encrypt a directory by creating an encrypted archive"""
-        # Create a temporary directory to store the encrypted files
-        temp_dir = output_path + "_temp"
-        os.makedirs(temp_dir, exist_ok=True)
+        import json
+        import zipfile
         
         try:
-            # Walk through the directory and encrypt each file
-            for root, dirs, files in os.walk(input_dir):
-                # Create relative path
-                rel_path = os.path.relpath(root, input_dir)
-                if rel_path == ".":
-                    rel_path = ""
+            # Encrypted data does not compress, so entries are stored and streamed straight in
+            with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+                # Walk through the directory and encrypt each file; fwalk keeps the
+                # directory open so files are opened relative to it (POSIX only)
+                if hasattr(os, 'fwalk'):
+                    walker = os.fwalk(input_dir)
+                else:
+                    walker = ((root, dirs, files, None) for root, dirs, files in os.walk(input_dir))
                 
-                # Create corresponding directory in temp_dir
-                if rel_path:
-                    os.makedirs(os.path.join(temp_dir, rel_path), exist_ok=True)
+                for root, dirs, files, root_fd in walker:
+                    # Create relative path
+                    rel_path = os.path.relpath(root, input_dir)
+                    if rel_path == ".":
+                        rel_path = ""
+                    arc_dir = rel_path.replace(os.sep, "/") + "/" if rel_path else ""
+                    
+                    # Keep empty directories in the archive
+                    if arc_dir:
+                        zf.writestr(arc_dir, b"")
+                    
+                    # Encrypt each file
+                    for file in files:
+                        if root_fd is not None:
+                            infile = os.fdopen(os.open(file, os.O_RDONLY, dir_fd=root_fd), 'rb')
+                        else:
+                            infile = open(os.path.join(root, file), 'rb')
+                        
+                        with infile:
+                            # Entry metadata comes from the open file, not another path lookup
+                            st = os.fstat(infile.fileno())
+                            date_time = max(time.localtime(st.st_mtime)[:6], (1980, 1, 1, 0, 0, 0))
+                            zinfo = zipfile.ZipInfo(arc_dir + file + DEFAULT_ENCRYPTION_EXTENSION, date_time)
+                            zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+                            with zf.open(zinfo, 'w', force_zip64=True) as outfile:
+                                self._encrypt_stream(infile, outfile)
                 
-                # Encrypt each file
-                for file in files:
-                    src_file = os.path.join(root, file)
-                    dst_file = os.path.join(temp_dir, rel_path, file + DEFAULT_ENCRYPTION_EXTENSION)
-                    self._encrypt_file(src_file, dst_file)
-            
-            # Create a metadata file with directory structure
-            metadata_path = os.path.join(temp_dir, "directory_structure.json")
-            with open(metadata_path, 'w') as f:
-                import json
+                # Create a metadata file with directory structure
                 structure = {"type": "directory", "name": os.path.basename(input_dir)}
-                json.dump(structure, f)
-            
-            # Create the final encrypted directory
-            shutil.make_archive(output_path, 'zip', temp_dir)
-            os.rename(output_path + ".zip", output_path)
-            
-        finally:
-            # Clean up temporary directory
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+                zf.writestr("directory_structure.json", json.dumps(structure))
+        except Exception:
+            # Do not leave a half written archive behind
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
     
     def _decrypt_directory(self, input_path: str, output_dir: str):
         """Decrypt a directory from an encrypted archive"""
-        # Create a temporary directory to extract the encrypted files
-        temp_dir = input_path + "_temp"
-        os.makedirs(temp_dir, exist_ok=True)
+        import zipfile
         
         try:
-            # Rename to zip for extraction
-            temp_zip = input_path + ".zip"
-            shutil.copy2(input_path, temp_zip)
-            
-            # Extract the encrypted files
-            import zipfile
-            with zipfile.ZipFile(temp_zip, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            
-            # Create the output directory
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Check for metadata file
-            metadata_path = os.path.join(temp_dir, "directory_structure.json")
-            if os.path.exists(metadata_path):
-                # This is a directory we encrypted
-                # Walk through the temp directory and decrypt each file
-                for root, dirs, files in os.walk(temp_dir):
+            # zipfile does not need a .zip name
+            with zipfile.ZipFile(input_path, 'r') as zip_ref:
+                # Create the output directory
+                os.makedirs(output_dir, exist_ok=True)
+                
+                # Check for metadata file
+                if "directory_structure.json" not in zip_ref.namelist():
+                    # This might be a regular zip file, just extract it
+                    zip_ref.extractall(output_dir)
+                    return
+                
+                # This is a directory we encrypted, decrypt each member straight
+                # from the archive without extracting it first
+                for zinfo in zip_ref.infolist():
                     # Skip metadata file
-                    if "directory_structure.json" in files:
-                        files.remove("directory_structure.json")
+                    if zinfo.filename == "directory_structure.json":
+                        continue
                     
-                    # Create relative path
-                    rel_path = os.path.relpath(root, temp_dir)
-                    if rel_path == ".":
-                        rel_path = ""
+                    # Drop empty, "." and ".." parts so members stay inside output_dir
+                    parts = [part for part in zinfo.filename.split("/") if part not in ("", ".", "..")]
+                    if not parts:
+                        continue
+                    target = os.path.join(output_dir, *parts)
                     
                     # Create corresponding directory in output_dir
-                    if rel_path:
-                        os.makedirs(os.path.join(output_dir, rel_path), exist_ok=True)
+                    if zinfo.is_dir():
+                        os.makedirs(target, exist_ok=True)
+                        continue
                     
                     # Decrypt each file
-                    for file in files:
-                        if file.endswith(DEFAULT_ENCRYPTION_EXTENSION):
-                            src_file = os.path.join(root, file)
-                            dst_file = os.path.join(output_dir, rel_path, file[:-len(DEFAULT_ENCRYPTION_EXTENSION)])
-                            self._decrypt_file(src_file, dst_file)
-            else:
-                # This might be a regular zip file, just extract it
-                shutil.rmtree(output_dir)
-                shutil.copytree(temp_dir, output_dir)
+                    if target.endswith(DEFAULT_ENCRYPTION_EXTENSION):
+                        os.makedirs(os.path.dirname(target), exist_ok=True)
+                        with zip_ref.open(zinfo) as infile:
+                            self._decrypt_stream(infile, target[:-len(DEFAULT_ENCRYPTION_EXTENSION)])
             
         except Exception as e:
             raise ValueError(f"Failed to decrypt directory: {str(e)}")
-        
-        finally:
-            # Clean up temporary files
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-            if os.path.exists(temp_zip):
-                os.remove(temp_zip)
+    
+    def cancel(self):
+        self.is_cancelled = True
+
+class FileOperationWorker(QThread):
+    """Worker thread for moving, copying or deleting files chosen in the file view"""
+    progress_updated = pyqtSignal(int, int)  # current, total
+    status_updated = pyqtSignal(str)
+    operation_completed = pyqtSignal(bool, str)  # success, message
+    
+    def __init__(self, operation: str, items: List[Tuple[str, Optional[str]]], dest_dir: str = ""):
+        super().__init__()
+        self.operation = operation  # "move", "copy" or "delete"
+        self.items = items  # (source, destination) pairs, destination is None for deletes
+        self.dest_dir = dest_dir
+        self.is_cancelled = False
+        # Filled in once the run is over, for the GUI thread to update the view
+        self.completed: List[str] = []
+        self.failures: List[Tuple[str, str]] = []  # source, error message
+        self._signals = _SignalThrottle(self.progress_updated, self.status_updated)
+    
+    def run(self):
+        try:
+            total = len(self.items)
+            processed = 0
+            verb = {"move": "Moving", "copy": "Copying", "delete": "Deleting"}[self.operation]
+            self._signals.status(f"{verb} {total} items...", force=True)
+            
+            # Files are independent, so they share the organizer's I/O pool
+            executor = _io_executor()
+            futures = {executor.submit(self._process_item, source, dest): source for source, dest in self.items}
+            
+            for future in as_completed(futures):
+                if self.is_cancelled:
+                    break
+                processed += 1
+                self._signals.progress(processed, total)
+            
+            if self.is_cancelled:
+                # Drop queued tasks from the shared pool and let running ones finish
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+            
+            # Record what happened to every file that was started, in selection order
+            for future, source in futures.items():
+                if future.cancelled():
+                    continue
+                error = future.exception()
+                if error is None:
+                    self.completed.append(source)
+                else:
+                    logger.error(f"Error processing {source}: {str(error)}")
+                    self.failures.append((source, str(error)))
+            
+            self._signals.flush(processed, total)
+            count = len(self.completed)
+            if self.operation == "move":
+                message = f"Moved {count} files to {self.dest_dir}"
+            elif self.operation == "copy":
+                message = f"Copied {count} files to {self.dest_dir}"
+            elif get_trash_function() is not None:
+                message = f"Moved {count} items to the trash"
+            else:
+                message = f"Deleted {count} items"
+            if self.is_cancelled:
+                self.operation_completed.emit(False, f"Operation cancelled. {message}")
+            else:
+                self.operation_completed.emit(True, message)
+            
+        except Exception as e:
+            logger.error(f"File operation error: {str(e)}")
+            self.operation_completed.emit(False, f"Error: {str(e)}")
+    
+    def _process_item(self, source: str, dest: Optional[str]):
+        """Move, copy or delete one file or folder"""
+        if self.operation == "move":
+            shutil.move(source, dest)
+        elif self.operation == "copy":
+            if os.path.isdir(source):
+                shutil.copytree(source, dest, copy_function=_fast_copy)
+            else:
+                _fast_copy(source, dest)
+        elif get_trash_function() is not None:
+            # The OS moves the item into its trash folder, which also makes it undoable
+            get_trash_function()(source)
+        elif os.path.isdir(source):
+            shutil.rmtree(source)
+        else:
+            os.remove(source)
     
     def cancel(self):
         self.is_cancelled = True
@@ -1429,12 +2639,74 @@ class FilePreviewPanel(QFrame):
         
         # Current file path
         self.current_file = None
+        
+        # Rapid selection changes only load the file selected last; a hidden
+        # panel waits until it is shown again
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._do_preview)
+        self._preview_stale = False
+        
+        # Decoded previews of recently viewed images, so going back is instant
+        self._preview_cache = _LRUCache(8)  # CUSTOMIZABLE: Number of cached previews
+        # Bumped for every preview request so late decodes of other files are dropped
+        self._preview_generation = 0
+        # (path, decoded image) of the image on display, rescaled when the panel is resized
+        self._last_image: Optional[Tuple[str, QImage]] = None
+        # Properties of the folder on display, completed once its contents are counted
+        self._folder_properties = ""
     
     def set_file(self, file_path):
         """Set the file to preview and show properties"""
         self.current_file = file_path
         
-        if not file_path or not os.path.exists(file_path):
+        if not file_path:
+            self._preview_generation += 1
+            self._preview_timer.stop()
+            self._preview_stale = False
+            self._last_image = None
+            self.preview_content.setText("No file selected")
+            self.properties_content.setText("No file selected")
+            return
+        
+        self._preview_generation += 1
+        # CUSTOMIZABLE: Delay before loading the preview (ms)
+        self._preview_timer.start(120)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._preview_stale:
+            self._do_preview()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        last = self._last_image
+        if last is None or last[0] != self.current_file:
+            return
+        
+        # Shrinking (or growing within the decoded size) only rescales the image
+        # already in memory; growing past it decodes the file again at the new size
+        image = last[1]
+        size = self.preview_content.size()
+        if image.size().scaled(size, Qt.KeepAspectRatio).width() <= image.width():
+            self.preview_content.setPixmap(QPixmap.fromImage(
+                image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
+        else:
+            self._preview_timer.start(120)
+    
+    def _do_preview(self):
+        """Load the preview and properties of the current file"""
+        if not self.isVisible():
+            self._preview_stale = True
+            return
+        self._preview_stale = False
+        
+        file_path = self.current_file
+        if self._last_image is not None and self._last_image[0] != file_path:
+            self._last_image = None
+        # One stat answers both whether the file exists and its properties
+        file_stat = _stat_or_none(file_path) if file_path else None
+        if file_stat is None:
             self.preview_content.setText("No file selected")
             self.properties_content.setText("No file selected")
             return
@@ -1442,43 +2714,28 @@ class FilePreviewPanel(QFrame):
         try:
             # Get file information for properties
             file_name = os.path.basename(file_path)
-            created_date = get_file_date(file_path, "created")
-            modified_date = get_file_date(file_path, "modified")
+            is_dir = stat.S_ISDIR(file_stat.st_mode)
+            created_date = get_file_date(file_stat, "created")
+            modified_date = get_file_date(file_stat, "modified")
             
             properties_text = f"<b>Name:</b> {file_name}<br>"
             properties_text += f"<b>Path:</b> {file_path}<br>"
             properties_text += f"<b>Created:</b> {created_date.strftime('%Y-%m-%d %H:%M:%S')}<br>"
             properties_text += f"<b>Modified:</b> {modified_date.strftime('%Y-%m-%d %H:%M:%S')}<br>"
             
-            if os.path.isdir(file_path):
-                # Count items in directory
-                try:
-                    items = os.listdir(file_path)
-                    num_files = len([i for i in items if os.path.isfile(os.path.join(file_path, i))])
-                    num_dirs = len([i for i in items if os.path.isdir(os.path.join(file_path, i))])
-                    
-                    # Calculate directory size
-                    dir_size = get_directory_size(file_path)
-                    
-                    properties_text += f"<b>Type:</b> Folder<br>"
-                    properties_text += f"<b>Size:</b> {format_size(dir_size)}<br>"
-                    properties_text += f"<b>Contents:</b> {len(items)} items ({num_files} files, {num_dirs} folders)<br>"
-                    
-                    # Show folder icon for preview
-                    icon = FileIcons.get_file_icon(file_path)
-                    pixmap = icon.pixmap(128, 128)
-                    self.preview_content.setPixmap(pixmap)
-                except:
-                    properties_text += f"<b>Type:</b> Folder<br>"
-                    properties_text += f"<b>Contents:</b> Unable to read folder contents<br>"
-                    
-                    # Show folder icon for preview
-                    icon = FileIcons.get_file_icon(file_path)
-                    pixmap = icon.pixmap(128, 128)
-                    self.preview_content.setPixmap(pixmap)
+            if is_dir:
+                properties_text += f"<b>Type:</b> Folder<br>"
+                
+                # Counting a large tree takes a while, so size and contents are
+                # filled in from the thread pool
+                self._start_folder_summary(file_path, properties_text)
+                properties_text += f"<b>Size:</b> Calculating...<br>"
+                
+                # Show folder icon for preview
+                self.preview_content.setPixmap(get_file_icon_pixmap(file_path, 128, is_dir=True))
             else:
                 # File properties
-                file_size = os.path.getsize(file_path)
+                file_size = file_stat.st_size
                 file_type = get_file_category(file_path)
                 
                 properties_text += f"<b>Type:</b> {file_type}<br>"
@@ -1491,32 +2748,10 @@ class FilePreviewPanel(QFrame):
                 
                 # Update preview based on file type
                 if file_type == "Images":
-                    try:
-                        pixmap = QPixmap(file_path)
-                        if not pixmap.isNull():
-                            # Scale to fit while maintaining aspect ratio
-                            pixmap = pixmap.scaled(
-                                self.preview_content.width(), 
-                                self.preview_content.height(),
-                                Qt.KeepAspectRatio, 
-                                Qt.SmoothTransformation
-                            )
-                            self.preview_content.setPixmap(pixmap)
-                        else:
-                            # If image loading fails, show icon
-                            icon = FileIcons.get_file_icon(file_path)
-                            pixmap = icon.pixmap(128, 128)
-                            self.preview_content.setPixmap(pixmap)
-                    except:
-                        # If image loading fails, show icon
-                        icon = FileIcons.get_file_icon(file_path)
-                        pixmap = icon.pixmap(128, 128)
-                        self.preview_content.setPixmap(pixmap)
+                    self._start_image_preview(file_path, file_stat)
                 else:
                     # For non-image files, show icon
-                    icon = FileIcons.get_file_icon(file_path)
-                    pixmap = icon.pixmap(128, 128)
-                    self.preview_content.setPixmap(pixmap)
+                    self.preview_content.setPixmap(get_file_icon_pixmap(file_path, 128, is_dir=False))
             
             # Set the properties text
             self.properties_content.setHtml(properties_text)
@@ -1525,22 +2760,89 @@ class FilePreviewPanel(QFrame):
             self.properties_content.setText(f"Error getting properties: {str(e)}")
             
             # Show default icon for preview
-            icon = FileIcons.get_file_icon(file_path)
-            pixmap = icon.pixmap(128, 128)
-            self.preview_content.setPixmap(pixmap)
+            self.preview_content.setPixmap(get_file_icon_pixmap(file_path, 128))
+
+    def _start_folder_summary(self, file_path, properties_text):
+        """Count a folder's contents on the thread pool"""
+        self._preview_generation += 1
+        generation = self._preview_generation
+        self._folder_properties = properties_text
+        
+        task = FolderSummaryTask(generation, file_path,
+                                 is_current=lambda: self._preview_generation == generation)
+        task.signals.ready.connect(self._on_folder_summary_ready)
+        self._folder_summary_signals = task.signals
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_folder_summary_ready(self, generation, file_path, summary):
+        """Show the size and contents of a folder if it is still the current file"""
+        if generation != self._preview_generation or file_path != self.current_file:
+            return
+        
+        properties_text = self._folder_properties
+        if summary is None:
+            properties_text += f"<b>Contents:</b> Unable to read folder contents<br>"
+        else:
+            # Counts and size come from the same directory scan
+            num_files, num_dirs, dir_size = summary
+            properties_text += f"<b>Size:</b> {format_size(dir_size)}<br>"
+            properties_text += f"<b>Contents:</b> {num_files + num_dirs} items ({num_files} files, {num_dirs} folders)<br>"
+        self.properties_content.setHtml(properties_text)
+    
+    def _start_image_preview(self, file_path, file_stat):
+        """Show a cached preview or decode the image on the thread pool"""
+        width = self.preview_content.width()
+        height = self.preview_content.height()
+        key = (file_path, file_stat.st_mtime_ns, width, height)
+        image = self._preview_cache.get(key)
+        if image is not None:
+            self._show_image(file_path, image)
+            return
+        
+        # Show the file type icon while the image is decoded (a resized preview
+        # keeps showing the old image instead)
+        if self._last_image is None:
+            self.preview_content.setPixmap(get_file_icon_pixmap(file_path, 128, is_dir=False))
+        self._preview_generation += 1
+        generation = self._preview_generation
+        
+        # Decode straight to the preview size, scaled to fit while
+        # maintaining aspect ratio
+        task = PreviewTask(generation, key, file_path, width, height,
+                           is_current=lambda: self._preview_generation == generation)
+        task.signals.ready.connect(self._on_preview_ready)
+        self._preview_signals = task.signals
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_preview_ready(self, generation, key, image):
+        """Show an image decoded in the background if it is still the current file"""
+        if generation != self._preview_generation or key[0] != self.current_file:
+            return
+        if image.isNull():
+            # If image loading fails, keep the icon
+            return
+        self._preview_cache[key] = image
+        self._show_image(key[0], image)
+    
+    def _show_image(self, file_path, image):
+        """Display a decoded preview image"""
+        self._last_image = (file_path, image)
+        self.preview_content.setPixmap(QPixmap.fromImage(image))
 
 class FileTileWidget(QFrame):
     """Widget for displaying a file as a tile"""
     clicked = pyqtSignal(str)  # Signal emitted when tile is clicked
     double_clicked = pyqtSignal(str)  # Signal emitted when tile is double-clicked
     right_clicked = pyqtSignal(str, QPoint)  # Signal emitted when tile is right-clicked
+    # CUSTOMIZABLE: File tile size
+    TILE_SIZE = 150
     
-    def __init__(self, file_path, parent=None):
+    def __init__(self, file_path, parent=None, is_current: Optional[Callable[[], bool]] = None,
+                 is_dir: Optional[bool] = None):
         super().__init__(parent)
         self.file_path = file_path
         self.setObjectName("tile")
-        # CUSTOMIZABLE: File tile size
-        self.setFixedSize(150, 150)  # Width, height
+        self.setFixedSize(self.TILE_SIZE, self.TILE_SIZE)  # Width, height
         self.setCursor(QCursor(Qt.PointingHandCursor))
         self.selected = False
         
@@ -1554,8 +2856,21 @@ class FileTileWidget(QFrame):
         self.icon_label = QLabel()
         self.icon_label.setAlignment(Qt.AlignCenter)
         
-        # Set thumbnail based on file type
-        pixmap = get_file_thumbnail(file_path)
+        # Set thumbnail based on file type. Everything but images shows the icon
+        # shared by its extension; images not decoded yet this session show that
+        # icon until a pool thread has loaded the thumbnail
+        if is_dir is None:
+            is_dir = os.path.isdir(file_path)
+        pixmap = None
+        if not is_dir and get_file_category(file_path) == "Images":
+            pixmap = ThumbnailCache.instance().cached_pixmap(file_path)
+            if pixmap is None:
+                task = ThumbnailTask(file_path, 64, is_current)
+                task.signals.done.connect(self._on_thumbnail_ready)
+                self._thumbnail_signals = task.signals
+                QThreadPool.globalInstance().start(task)
+        if pixmap is None:
+            pixmap = get_file_icon_pixmap(file_path, 64, is_dir)
         self.icon_label.setPixmap(pixmap)
         
         layout.addWidget(self.icon_label)
@@ -1574,13 +2889,11 @@ class FileTileWidget(QFrame):
         
         layout.addWidget(self.name_label)
         
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        # CUSTOMIZABLE: Tile shadow properties
-        shadow.setBlurRadius(10)  # Shadow blur radius
-        shadow.setColor(QColor(0, 0, 0, 80))  # Shadow color and opacity
-        shadow.setOffset(0, 2)  # Shadow offset (x, y)
-        self.setGraphicsEffect(shadow)
+        # The drop shadow is painted by the tile container (see _TileContainer)
+    
+    def _on_thumbnail_ready(self, key, image):
+        """Show a thumbnail loaded in the background"""
+        self.icon_label.setPixmap(ThumbnailCache.instance().remember(key, image))
     
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -1603,6 +2916,59 @@ class FileTileWidget(QFrame):
         else:
             self.setStyleSheet("")
 
+class _TileContainer(QWidget):
+    """Tile grid canvas that paints one shared, pre-blurred shadow under each tile"""
+    # CUSTOMIZABLE: Tile shadow properties
+    SHADOW_BLUR = 10  # Shadow blur radius
+    SHADOW_COLOR = QColor(0, 0, 0, 80)  # Shadow color and opacity
+    SHADOW_OFFSET = QPoint(0, 2)  # Shadow offset (x, y)
+    SHADOW_CORNER = 8  # Matches the tile corner radius
+    
+    _shadow: Optional[QPixmap] = None
+    
+    @classmethod
+    def shadow_pixmap(cls) -> QPixmap:
+        """Blur a small rounded rectangle once; it is stretched as a nine-slice for every tile"""
+        if cls._shadow is None:
+            pad = cls.SHADOW_BLUR
+            side = 2 * (2 * pad + cls.SHADOW_CORNER) + 2
+            shape = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+            shape.fill(Qt.transparent)
+            painter = QPainter(shape)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(cls.SHADOW_COLOR)
+            painter.drawRoundedRect(pad, pad, side - 2 * pad, side - 2 * pad, cls.SHADOW_CORNER, cls.SHADOW_CORNER)
+            painter.end()
+            
+            scene = QGraphicsScene()
+            item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+            blur = QGraphicsBlurEffect()
+            blur.setBlurRadius(pad)
+            item.setGraphicsEffect(blur)
+            scene.addItem(item)
+            
+            shadow = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+            shadow.fill(Qt.transparent)
+            painter = QPainter(shadow)
+            scene.render(painter, QRectF(0, 0, side, side), QRectF(0, 0, side, side))
+            painter.end()
+            cls._shadow = QPixmap.fromImage(shadow)
+        return cls._shadow
+    
+    def paintEvent(self, event):
+        pixmap = self.shadow_pixmap()
+        # Corner slices hold the blur falloff on both sides of the tile edge
+        edge = 2 * self.SHADOW_BLUR + self.SHADOW_CORNER
+        margins = QMargins(edge, edge, edge, edge)
+        grow = QMargins(self.SHADOW_BLUR, self.SHADOW_BLUR, self.SHADOW_BLUR, self.SHADOW_BLUR)
+        painter = QPainter(self)
+        for tile in self.findChildren(FileTileWidget, options=Qt.FindDirectChildrenOnly):
+            target = tile.geometry().marginsAdded(grow).translated(self.SHADOW_OFFSET)
+            if tile.isVisible() and target.intersects(event.rect()):
+                qDrawBorderPixmap(painter, target, margins, pixmap)
+        painter.end()
+
 class FileTileView(QScrollArea):
     """Widget for displaying files as tiles in a grid"""
     file_clicked = pyqtSignal(str)  # Signal emitted when a file is clicked
@@ -1615,15 +2981,15 @@ class FileTileView(QScrollArea):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         
-        # Container widget
-        self.container = QWidget()
+        # Container widget; tiles are placed on a grid by hand so only the rows
+        # in and near the viewport need real widgets
+        self.container = _TileContainer()
         self.setWidget(self.container)
-        
-        # Grid layout for tiles
-        self.grid_layout = QGridLayout(self.container)
-        # CUSTOMIZABLE: Grid layout margins
-        self.grid_layout.setContentsMargins(16, 16, 16, 16)  # Left, top, right, bottom
-        self.grid_layout.setSpacing(16)  # CUSTOMIZABLE: Spacing between tiles
+        self.grid_margin = 16  # CUSTOMIZABLE: Grid margins
+        self.grid_spacing = 16  # CUSTOMIZABLE: Spacing between tiles
+        self.prefetch_rows = 2  # CUSTOMIZABLE: Rows of tiles kept ready above and below the viewport
+        self._columns = 1
+        self.verticalScrollBar().valueChanged.connect(self._update_visible_tiles)
         
         # List of files
         self.files = []
@@ -1632,10 +2998,26 @@ class FileTileView(QScrollArea):
         self.search_text = ""
         self.show_files = True
         self.show_folders = True
+        # Bumped whenever files changes, so a filter pass knows its input is stale
+        self._files_generation = 0
+        # Inputs of the last filter pass, used to narrow a search as it is typed
+        self._last_filter = None
         
         # Selected files
         self.selected_files = set()
         self.tile_widgets = {}  # Map of file paths to tile widgets
+        # Bumped whenever tiles are thrown away so their pending thumbnails are skipped
+        self._thumbnail_generation = 0
+        # (is_dir, category, lowercase name) per file, read once so filtering
+        # never touches the file system
+        self._meta: Dict[str, Tuple[bool, str, str]] = {}
+        # Set by the file and filter setters; the filters are re-run once per
+        # layout update instead of on every call
+        self._filters_dirty = False
+        # Position of each filtered file, for shift-click ranges
+        self._filtered_index: Dict[str, int] = {}
+        # File the next shift-click range starts from
+        self._selection_anchor: Optional[str] = None
         
         # Accept drops
         self.setAcceptDrops(True)
@@ -1653,39 +3035,48 @@ class FileTileView(QScrollArea):
         if event.type() == QEvent.KeyPress:
             # Check if backspace key is pressed
             if event.key() == Qt.Key_Backspace:
-                # Emit a signal that can be caught by the main window
-                if hasattr(self, 'parent') and self.parent():
-                    # Find the main window
-                    main_window = self.parent()
-                    while main_window and not isinstance(main_window, QMainWindow):
-                        main_window = main_window.parent()
-                    
-                    if main_window and hasattr(main_window, 'navigate_to_parent_folder'):
-                        main_window.navigate_to_parent_folder()
-                        return True
+                # Let the main window go up one folder
+                main_window = self.window()
+                if isinstance(main_window, QMainWindow) and hasattr(main_window, 'navigate_to_parent_folder'):
+                    main_window.navigate_to_parent_folder()
+                    return True
         
         return super().eventFilter(obj, event)
     
     def clear(self):
         """Clear all tiles"""
-        # Remove all widgets from the layout
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Remove all tile widgets
+        for tile in self.tile_widgets.values():
+            tile.deleteLater()
+        self.container.setMinimumHeight(0)
         
         self.files = []
         self.filtered_files = []
+        self._files_generation += 1
+        self._last_filter = None
+        self._filtered_index.clear()
+        self._selection_anchor = None
         self.selected_files.clear()
         self.tile_widgets.clear()
+        self._meta.clear()
+        self._thumbnail_generation += 1
+    
+    @staticmethod
+    def _file_meta(file_path, is_dir: Optional[bool] = None) -> Tuple[bool, str, str]:
+        """Read the metadata the filters need for a file (pass is_dir to skip the stat)"""
+        if is_dir is None:
+            is_dir = os.path.isdir(file_path)
+        return (is_dir, get_file_category(file_path), os.path.basename(file_path).lower())
     
     def add_file(self, file_path):
         """Add a file to the view"""
-        if file_path in self.files:
+        if file_path in self._meta:
             return
         
         self.files.append(file_path)
-        self._apply_filters()
+        self._meta[file_path] = self._file_meta(file_path)
+        self._files_generation += 1
+        self._filters_dirty = True
         # Use timer to batch updates and prevent flashing
         self.update_timer.start(100)
     
@@ -1693,110 +3084,181 @@ class FileTileView(QScrollArea):
         """Add multiple files to the view"""
         added = False
         for file_path in file_paths:
-            if file_path not in self.files:
+            if file_path not in self._meta:
                 self.files.append(file_path)
+                self._meta[file_path] = self._file_meta(file_path)
                 added = True
         
         if added:
-            self._apply_filters()
+            self._files_generation += 1
+            self._filters_dirty = True
+            # Use timer to batch updates and prevent flashing
+            self.update_timer.start(100)
+    
+    def add_entries(self, entries):
+        """Add os.scandir entries to the view, using the type the scan already read"""
+        added = False
+        for entry in entries:
+            file_path = entry.path
+            if file_path not in self._meta:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                self.files.append(file_path)
+                self._meta[file_path] = self._file_meta(file_path, is_dir)
+                added = True
+        
+        if added:
+            self._files_generation += 1
+            self._filters_dirty = True
             # Use timer to batch updates and prevent flashing
             self.update_timer.start(100)
     
     def remove_file(self, file_path):
         """Remove a file from the view"""
-        if file_path in self.files:
-            self.files.remove(file_path)
-            if file_path in self.selected_files:
-                self.selected_files.remove(file_path)
-            self._apply_filters()
+        self.remove_files([file_path])
+    
+    def remove_files(self, file_paths):
+        """Remove multiple files from the view"""
+        removed = {p for p in file_paths if p in self._meta}
+        if removed:
+            self.files = [f for f in self.files if f not in removed]
+            for file_path in removed:
+                del self._meta[file_path]
+            self.selected_files -= removed
+            self._files_generation += 1
+            self._last_filter = None
+            self._filters_dirty = True
             # Use timer to batch updates and prevent flashing
             self.update_timer.start(100)
     
     def set_category_filter(self, category):
         """Set the category filter"""
         self.current_category = category
-        self._apply_filters()
+        self._filters_dirty = True
         self.update_timer.start(100)
     
     def set_search_filter(self, search_text):
         """Set the search filter"""
         self.search_text = search_text.lower()
-        self._apply_filters()
+        self._filters_dirty = True
         self.update_timer.start(100)
     
     def set_file_folder_filter(self, show_files, show_folders):
         """Set whether to show files and/or folders"""
         self.show_files = show_files
         self.show_folders = show_folders
-        self._apply_filters()
+        self._filters_dirty = True
         self.update_timer.start(100)
     
     def _apply_filters(self):
         """Apply category and search filters to the file list"""
-        # Start with all files
-        filtered = []
-        
-        # Apply file/folder filter
-        for f in self.files:
-            try:
-                is_dir = os.path.isdir(f)
-                if (is_dir and self.show_folders) or (not is_dir and self.show_files):
-                    filtered.append(f)
-            except Exception as e:
-                logger.error(f"Error checking if path is directory: {f}, {str(e)}")
-        
-        # Apply category filter
-        if self.current_category != "All Files" and self.current_category not in ["Files", "Folders"]:
-            filtered = [f for f in filtered if not os.path.isdir(f) and get_file_category(f) == self.current_category]
-        elif self.current_category == "Files":
-            filtered = [f for f in filtered if not os.path.isdir(f)]
-        elif self.current_category == "Folders":
-            filtered = [f for f in filtered if os.path.isdir(f)]
+        category = self.current_category
+        search_text = self.search_text
+        meta = self._meta
+        
+        # Which kinds of entries pass the file/folder and category filters
+        show_dirs = self.show_folders and category in ("All Files", "Folders")
+        show_files = self.show_files and category != "Folders"
+        any_category = category in ("All Files", "Files")
+        
+        filter_key = (self._files_generation, category, show_dirs, show_files)
+        last = self._last_filter
+        self._last_filter = (filter_key, search_text)
+        
+        # Typing more of a search can only drop matches, so only the previous
+        # results need checking again
+        if search_text and last is not None and last[0] == filter_key and last[1] in search_text:
+            filtered = [f for f in self.filtered_files if search_text in meta[f][2]]
+            self.filtered_files = filtered
+            self._filtered_index = {f: i for i, f in enumerate(filtered)}
+            return
         
-        # Apply search filter
-        if self.search_text:
-            filtered = [f for f in filtered if self.search_text in os.path.basename(f).lower()]
+        # Everything comes from the metadata cache, no file system calls per keystroke
+        if show_dirs and show_files and any_category:
+            filtered = self.files
+        else:
+            filtered = [
+                f for f in self.files
+                if (show_dirs if meta[f][0] else show_files and (any_category or meta[f][1] == category))
+            ]
+        
+        # Apply search filter against the cached lowercase names
+        if search_text:
+            filtered = [f for f in filtered if search_text in meta[f][2]]
+        elif filtered is self.files:
+            # Keep a snapshot, files keeps changing as files are added and removed
+            filtered = list(filtered)
         
         self.filtered_files = filtered
+        self._filtered_index = {f: i for i, f in enumerate(filtered)}
     
     def _update_layout(self):
         """Update the grid layout with current files"""
-        # Clear the layout
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-    
-        # Clear the tile widgets dictionary
-        self.tile_widgets.clear()
-    
+        if self._filters_dirty:
+            self._filters_dirty = False
+            self._apply_filters()
+        
         # Calculate number of columns based on container width
         container_width = self.viewport().width()
-        tile_width = 150 + self.grid_layout.spacing()  # CUSTOMIZABLE: Tile width calculation
-        columns = max(1, container_width // tile_width)
+        tile_width = FileTileWidget.TILE_SIZE + self.grid_spacing  # CUSTOMIZABLE: Tile width calculation
+        self._columns = max(1, container_width // tile_width)
+        
+        # Size the container for every row so the scroll bar covers all files
+        rows = -(-len(self.filtered_files) // self._columns)
+        height = 2 * self.grid_margin + rows * tile_width - self.grid_spacing if rows else 0
+        self.container.setMinimumHeight(height)
+        
+        self._update_visible_tiles()
     
-        # Add tiles to the layout
-        for i, file_path in enumerate(self.filtered_files):
+    def _update_visible_tiles(self, _scroll_value=None):
+        """Create tiles for the rows in and near the viewport and delete the others"""
+        pitch = FileTileWidget.TILE_SIZE + self.grid_spacing
+        columns = self._columns
+        top = self.verticalScrollBar().value() - self.grid_margin
+        first_row = max(0, top // pitch - self.prefetch_rows)
+        last_row = (top + self.viewport().height()) // pitch + self.prefetch_rows
+        first_index = first_row * columns
+        visible = self.filtered_files[first_index:(last_row + 1) * columns]
+        
+        # Tiles scrolled away or filtered out are deleted, the rest are reused
+        shown = set(visible)
+        for file_path in [p for p in self.tile_widgets if p not in shown]:
+            self.tile_widgets.pop(file_path).deleteLater()
+        
+        # Pending thumbnails of deleted tiles are skipped
+        generation = self._thumbnail_generation
+        
+        for i, file_path in enumerate(visible, first_index):
             row = i // columns
             col = i % columns
+            
+            tile = self.tile_widgets.get(file_path)
+            if tile is None:
+                # Create the tile widget
+                is_current = lambda p=file_path: self._thumbnail_generation == generation and p in self.tile_widgets
+                tile = FileTileWidget(file_path, self.container, is_current=is_current,
+                                      is_dir=self._meta[file_path][0])
+                
+                # Connect signals before adding to dictionary to avoid race conditions
+                tile.clicked.connect(self._on_tile_clicked)
+                tile.double_clicked.connect(self.file_double_clicked.emit)
+                tile.right_clicked.connect(self.file_right_clicked.emit)
+                
+                # Add to dictionary
+                self.tile_widgets[file_path] = tile
+                
+                # Set selected state if applicable
+                if file_path in self.selected_files:
+                    tile.set_selected(True)
+                tile.show()
+            
+            # Place the tile in its grid cell
+            tile.move(self.grid_margin + col * pitch, self.grid_margin + row * pitch)
         
-            # Create the tile widget
-            tile = FileTileWidget(file_path)
-        
-            # Connect signals before adding to dictionary to avoid race conditions
-            tile.clicked.connect(self._on_tile_clicked)
-            tile.double_clicked.connect(self.file_double_clicked.emit)
-            tile.right_clicked.connect(self.file_right_clicked.emit)
-        
-            # Add to layout
-            self.grid_layout.addWidget(tile, row, col)
-        
-            # Add to dictionary after adding to layout
-            self.tile_widgets[file_path] = tile
-        
-            # Set selected state if applicable
-            if file_path in self.selected_files:
-                tile.set_selected(True)
+        # Repaint the tile shadows, which reach outside the tiles themselves
+        self.container.update()
     
     def _on_tile_clicked(self, file_path):
         """Handle tile click with selection support"""
@@ -1808,7 +3270,7 @@ class FileTileView(QScrollArea):
             # Log the issue but don't crash - just return early
             logger.warning(f"Tile widget for {file_path} not found in tile_widgets dictionary")
             # Try to find the file in our files list and add it to the selection if it exists
-            if file_path in self.files:
+            if file_path in self._meta:
                 self.selected_files.add(file_path)
                 # Still emit the clicked signal so the file gets previewed
                 self.file_clicked.emit(file_path)
@@ -1822,13 +3284,14 @@ class FileTileView(QScrollArea):
             else:
                 self.selected_files.add(file_path)
                 self.tile_widgets[file_path].set_selected(True)
+            self._selection_anchor = file_path
         elif modifiers == Qt.ShiftModifier and self.selected_files:
-            # Range selection
-            last_selected = list(self.selected_files)[-1]
+            # Range selection from the last plainly or ctrl-clicked file
+            last_selected = self._selection_anchor or file_path
             # Make sure both files are in the filtered_files list
-            if last_selected in self.filtered_files and file_path in self.filtered_files:
-                start_idx = self.filtered_files.index(last_selected)
-                end_idx = self.filtered_files.index(file_path)
+            if last_selected in self._filtered_index and file_path in self._filtered_index:
+                start_idx = self._filtered_index[last_selected]
+                end_idx = self._filtered_index[file_path]
             
                 # Swap if needed to ensure start_idx <= end_idx
                 if start_idx > end_idx:
@@ -1849,6 +3312,7 @@ class FileTileView(QScrollArea):
         
             self.selected_files.clear()
             self.selected_files.add(file_path)
+            self._selection_anchor = file_path
             self.tile_widgets[file_path].set_selected(True)
     
         # Emit the clicked signal
@@ -1891,6 +3355,9 @@ class FileTileView(QScrollArea):
 # Main application window
 class MainWindow(QMainWindow):
     """Main application window"""
+    # Widgets where Backspace edits text instead of going to the parent folder
+    _TEXT_INPUT_CLASSES = ("QLineEdit", "QTextEdit", "QPlainTextEdit", "QAbstractSpinBox", "QComboBox")
+    
     def __init__(self):
         super().__init__()
         
@@ -1905,9 +3372,24 @@ class MainWindow(QMainWindow):
         self.organizer_worker = None
         self.encryption_worker = None
         
+        # Refreshes requested by operations finishing close together run only once
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(80)  # CUSTOMIZABLE: Delay before refreshing after an operation (ms)
+        self._refresh_timer.timeout.connect(self.refresh_files)
+        # Dialog for failed operations, created on first use and then reused
+        self._error_box = None
+        
         # Navigation history
-        self.path_history = []
+        # Oldest folders drop off once the history is full
+        self.path_history = deque(maxlen=128)  # CUSTOMIZABLE: Number of folders kept in the history
         self.current_path_index = -1
+        # Bumped for every folder opened so batches from an older scan are dropped
+        self._scan_generation = 0
+        # (folder, mtime) of the listing on display and of the scan in progress; a
+        # folder whose mtime has not changed still has the same entries
+        self._listing: Optional[Tuple[str, int]] = None
+        self._scan_listing: Optional[Tuple[str, int]] = None
         
         # Set up the UI
         self.setup_ui()
@@ -1992,39 +3474,19 @@ class MainWindow(QMainWindow):
         # Category buttons with icons - made bigger
         for category in FILE_CATEGORIES.keys():
             # Create icon with category-specific color
-            if category == "Images":
-                icon = FileIcons.create_icon("#FF7675", "IMG")
-            elif category == "Videos":
-                icon = FileIcons.create_icon("#6C5CE7", "VID")
-            elif category == "Audio":
-                icon = FileIcons.create_icon("#00B894", "AUD")
-            elif category == "Documents":
-                icon = FileIcons.create_icon("#0984E3", "DOC")
-            elif category == "PDF":
-                icon = FileIcons.create_icon("#E84393", "PDF")
-            elif category == "Excel":
-                icon = FileIcons.create_icon("#00B894", "XLS")
-            elif category == "PowerPoint":
-                icon = FileIcons.create_icon("#E84393", "PPT")
-            elif category == "Text":
-                icon = FileIcons.create_icon("#74B9FF", "TXT")
-            elif category == "Archives":
-                icon = FileIcons.create_icon("#A29BFE", "ZIP")
-            elif category == "Code":
-                icon = FileIcons.create_icon("#00CEC9", "CODE")
-            elif category == "Executables":
-                icon = FileIcons.create_icon("#FD79A8", "EXE")
-            elif category == "APK":
-                icon = FileIcons.create_icon("#55EFC4", "APK")
-            elif category == "Encrypted":
-                icon = FileIcons.create_icon("#636E72", "ENC")
-            else:
-                icon = FileIcons.create_icon("#B2BEC3", "FILE")
+            icon = FileIcons.get_category_icon(category)
             
             button = SidebarButton(category, icon=icon)
             sidebar_layout.addWidget(button)
             self.category_buttons.append(button)
         
+        # Only one category is checked at a time; the group unchecks the others
+        self.all_files_button = all_button
+        self.category_button_group = QButtonGroup(self)
+        self.category_button_group.setExclusive(True)
+        for button in self.category_buttons:
+            self.category_button_group.addButton(button)
+        
         sidebar_layout.addStretch()
         
         # Add to content layout
@@ -2049,7 +3511,7 @@ class MainWindow(QMainWindow):
         
         # Add files button
         add_files_btn = QPushButton("Add Files")
-        add_files_btn.setIcon(QApplication.style().standardIcon(QStyle.SP_FileDialogNewFolder))
+        add_files_btn.setIcon(FileIcons.standard_icon(QStyle.SP_FileDialogNewFolder))
         top_toolbar.addWidget(add_files_btn)
         self.add_files_btn = add_files_btn
         
@@ -2062,13 +3524,13 @@ class MainWindow(QMainWindow):
         # Clear button
         clear_btn = QPushButton("Clear")
         clear_btn.setObjectName("dangerButton")
-        clear_btn.setIcon(QApplication.style().standardIcon(QStyle.SP_DialogDiscardButton))
+        clear_btn.setIcon(FileIcons.standard_icon(QStyle.SP_DialogDiscardButton))
         top_toolbar.addWidget(clear_btn)
         self.clear_btn = clear_btn
         
         # Refresh button
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.setIcon(QApplication.style().standardIcon(QStyle.SP_BrowserReload))
+        refresh_btn.setIcon(FileIcons.standard_icon(QStyle.SP_BrowserReload))
         top_toolbar.addWidget(refresh_btn)
         self.refresh_btn = refresh_btn
         
@@ -2207,7 +3669,7 @@ class MainWindow(QMainWindow):
         # Organize button
         self.organize_btn = QPushButton("Organize Files")
         self.organize_btn.setObjectName("successButton")
-        self.organize_btn.setIcon(QApplication.style().standardIcon(QStyle.SP_DialogApplyButton))
+        self.organize_btn.setIcon(FileIcons.standard_icon(QStyle.SP_DialogApplyButton))
         organize_options_layout.addWidget(self.organize_btn)
         
         organize_layout.addWidget(organize_options_group)
@@ -2295,7 +3757,14 @@ class MainWindow(QMainWindow):
         # Status bar
         self.statusBar()
         
-        # Context menu for file operations
+        # Context menu for file operations, built on the first right-click
+        self.file_context_menu = None
+    
+    def _ensure_file_context_menu(self):
+        """Create the file context menu and its actions if not done yet"""
+        if self.file_context_menu is not None:
+            return
+        
         self.file_context_menu = QMenu(self)
         self.open_action = QAction("Open", self)
         self.open_location_action = QAction("Open Location", self)
@@ -2310,6 +3779,14 @@ class MainWindow(QMainWindow):
         self.file_context_menu.addAction(self.move_action)
         self.file_context_menu.addAction(self.copy_action)
         self.file_context_menu.addAction(self.delete_action)
+        
+        # Context menu actions
+        self.open_action.triggered.connect(self.open_selected_file)
+        self.open_location_action.triggered.connect(self.open_selected_file_location)
+        self.rename_action.triggered.connect(self.rename_selected_file)
+        self.move_action.triggered.connect(self.move_selected_file)
+        self.copy_action.triggered.connect(self.copy_selected_file)
+        self.delete_action.triggered.connect(self.delete_selected_file)
     
     def setup_title_bar(self, main_layout):
         """Set up custom title bar with window controls"""
@@ -2404,8 +3881,8 @@ class MainWindow(QMainWindow):
         self.organize_btn.clicked.connect(self.start_organize)
         
         # Encrypt/Decrypt tab - Modified for separate buttons
-        self.encrypt_btn.clicked.connect(lambda: self.start_encryption("encrypt"))
-        self.decrypt_btn.clicked.connect(lambda: self.start_encryption("decrypt"))
+        self.encrypt_btn.clicked.connect(self.start_encrypt)
+        self.decrypt_btn.clicked.connect(self.start_decrypt)
         
         # Category buttons
         for button in self.category_buttons:
@@ -2415,14 +3892,6 @@ class MainWindow(QMainWindow):
         self.file_view.file_clicked.connect(self.preview_file)
         self.file_view.file_double_clicked.connect(self.open_file)
         self.file_view.file_right_clicked.connect(self.show_file_context_menu)
-        
-        # Context menu actions
-        self.open_action.triggered.connect(self.open_selected_file)
-        self.open_location_action.triggered.connect(self.open_selected_file_location)
-        self.rename_action.triggered.connect(self.rename_selected_file)
-        self.move_action.triggered.connect(self.move_selected_file)
-        self.copy_action.triggered.connect(self.copy_selected_file)
-        self.delete_action.triggered.connect(self.delete_selected_file)
     
     def add_files(self):
         """Add files to the view"""
@@ -2432,6 +3901,8 @@ class MainWindow(QMainWindow):
         
         if files:
             self.file_view.add_files(files)
+            # The view no longer matches the folder alone
+            self._listing = None
             self.statusBar().showMessage(f"Added {len(files)} files")
     
     def add_folder(self):
@@ -2447,13 +3918,18 @@ class MainWindow(QMainWindow):
     def clear_files(self):
         """Clear the file view"""
         self.file_view.clear()
+        self._listing = None
         self.statusBar().showMessage("Cleared file list")
         self.preview_panel.set_file(None)
     
     def refresh_files(self):
         """Refresh the current view"""
         current_path = self.path_input.text().strip()
-        if current_path and os.path.exists(current_path):
+        path_stat = _stat_or_none(current_path) if current_path else None
+        if path_stat is not None:
+            if self._listing_is_current(current_path, path_stat):
+                self.statusBar().showMessage(f"Already up to date: {current_path}")
+                return
             self.navigate_to_path()
             self.statusBar().showMessage(f"Refreshed: {current_path}")
         else:
@@ -2465,50 +3941,93 @@ class MainWindow(QMainWindow):
         if not path:
             return
         
-        if not os.path.exists(path):
+        # A single stat tells whether the path exists, is a folder and its mtime
+        path_stat = _stat_or_none(path)
+        if path_stat is None:
             QMessageBox.warning(self, "Invalid Path", f"The path '{path}' does not exist.")
             return
         
+        # The folder on display has not changed, only reset the filters and history
+        if self._listing_is_current(path, path_stat):
+            self._on_directory_scanned(self._scan_generation, path, "")
+            return
+        
         # Clear current files
         self.file_view.clear()
-        
-        if os.path.isdir(path):
-            # Add files and folders from the directory
-            items = []
-            try:
-                for item in os.listdir(path):
-                    item_path = os.path.join(path, item)
-                    items.append(item_path)
-            
-                self.file_view.add_files(items)
-                self.statusBar().showMessage(f"Navigated to: {path}")
-            
-                # Reset category filter to "All Files" when opening a new folder
-                for button in self.category_buttons:
-                    if button.text() == "All Files":
-                        button.setChecked(True)
-                    else:
-                        button.setChecked(False)
-                self.file_view.set_category_filter("All Files")
-                self.file_view.set_file_folder_filter(True, True)
-            
-                # Add to navigation history
-                # If we're not at the end of the history, truncate it
-                if self.current_path_index < len(self.path_history) - 1:
-                    self.path_history = self.path_history[:self.current_path_index + 1]
+        self._listing = None
+        # Any folder scan still running belongs to the previous location
+        self._scan_generation += 1
+        
+        if stat.S_ISDIR(path_stat.st_mode):
+            # Remember the folder's mtime from before the scan, so changes made
+            # while it runs are picked up by the next refresh
+            self._scan_listing = (path, path_stat.st_mtime_ns)
             
-                # Add the new path to history if it's different from the current one
-                if not self.path_history or self.path_history[-1] != path:
-                    self.path_history.append(path)
-                    self.current_path_index = len(self.path_history) - 1
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Could not read directory: {str(e)}")
-                logger.error(f"Error reading directory {path}: {str(e)}")
+            # List the folder on the thread pool so the window keeps painting;
+            # entries show up in batches as the scan proceeds
+            generation = self._scan_generation
+            task = DirectoryScanTask(generation, path,
+                                     is_current=lambda: self._scan_generation == generation)
+            task.signals.batch.connect(self._on_directory_batch)
+            task.signals.done.connect(self._on_directory_scanned)
+            self._scan_signals = task.signals
+            self.statusBar().showMessage(f"Loading: {path}")
+            QThreadPool.globalInstance().start(task)
         else:
             # It's a file, add it to the view
             self.file_view.add_file(path)
             self.statusBar().showMessage(f"Added file: {path}")
     
+    def _listing_is_current(self, path, path_stat=None):
+        """Whether the view shows the complete, unchanged contents of a folder"""
+        if self._listing is None or self._listing[0] != path:
+            return False
+        if path_stat is None:
+            path_stat = _stat_or_none(path)
+            if path_stat is None:
+                return False
+        mtime = path_stat.st_mtime_ns
+        # Folder mtimes can be as coarse as two seconds, so a folder changed that
+        # recently is listed again rather than trusted
+        return mtime == self._listing[1] and time.time_ns() - mtime > 2_000_000_000
+    
+    def _on_directory_batch(self, generation, entries):
+        """Add entries found by the running folder scan"""
+        if generation == self._scan_generation:
+            # scandir entries already know whether they are folders, so no stat per item is needed
+            self.file_view.add_entries(entries)
+    
+    def _on_directory_scanned(self, generation, path, error):
+        """Finish opening a folder once its scan is complete"""
+        if generation != self._scan_generation:
+            return
+        if error:
+            QMessageBox.warning(self, "Error", f"Could not read directory: {error}")
+            return
+        
+        if self._scan_listing is not None and self._scan_listing[0] == path:
+            self._listing = self._scan_listing
+            self._scan_listing = None
+        self.statusBar().showMessage(f"Navigated to: {path}")
+        
+        # Reset category filter to "All Files" when opening a new folder
+        self.all_files_button.setChecked(True)
+        self.file_view.set_category_filter("All Files")
+        self.file_view.set_file_folder_filter(True, True)
+        
+        self._push_history(path)
+    
+    def _push_history(self, path):
+        """Add a successfully opened folder to the navigation history"""
+        # If we're not at the end of the history, truncate it
+        while len(self.path_history) > self.current_path_index + 1:
+            self.path_history.pop()
+        
+        # Add the new path to history if it's different from the current one
+        if not self.path_history or self.path_history[-1] != path:
+            self.path_history.append(path)
+            self.current_path_index = len(self.path_history) - 1
+    
     def navigate_to_parent_folder(self):
         """Navigate to the parent folder of the current path"""
         current_path = self.path_input.text().strip()
@@ -2562,11 +4081,6 @@ class MainWindow(QMainWindow):
         if not sender:
             return
         
-        # Uncheck all other buttons
-        for button in self.category_buttons:
-            if button != sender:
-                button.setChecked(False)
-        
         # Set the category filter
         category = sender.text()
         self.file_view.set_category_filter(category)
@@ -2611,6 +4125,7 @@ class MainWindow(QMainWindow):
     def show_file_context_menu(self, file_path, position):
         """Show context menu for a file"""
         self.selected_file = file_path
+        self._ensure_file_context_menu()
         self.file_context_menu.exec_(position)
     
     def open_selected_file(self):
@@ -2687,42 +4202,9 @@ class MainWindow(QMainWindow):
         if not dest_dir:
             return
         
-        moved_count = 0
-        for file_path in selected_files:
-            file_name = os.path.basename(file_path)
-            dest_path = os.path.join(dest_dir, file_name)
-            
-            # Check if destination already exists
-            if os.path.exists(dest_path):
-                response = QMessageBox.question(
-                    self, "File Exists",
-                    f"A file named '{file_name}' already exists in the destination. Overwrite?",
-                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-                )
-                
-                if response == QMessageBox.No:
-                    continue
-            
-            try:
-                # Move the file
-                shutil.move(file_path, dest_path)
-                
-                # Update the view
-                self.file_view.remove_file(file_path)
-                
-                # Update preview if needed
-                if self.preview_panel.current_file == file_path:
-                    self.preview_panel.set_file(None)
-                
-                moved_count += 1
-                
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Error", f"Failed to move file {file_name}: {str(e)}"
-                )
-        
-        if moved_count > 0:
-            self.statusBar().showMessage(f"Moved {moved_count} files to {dest_dir}")
+        items = self._confirm_destinations(selected_files, dest_dir)
+        if items:
+            self._run_file_operation("move", items, dest_dir, "Moving Files")
     
     def copy_selected_file(self):
         """Copy the selected file to a new location"""
@@ -2741,38 +4223,9 @@ class MainWindow(QMainWindow):
         if not dest_dir:
             return
         
-        copied_count = 0
-        for file_path in selected_files:
-            file_name = os.path.basename(file_path)
-            dest_path = os.path.join(dest_dir, file_name)
-            
-            # Check if destination already exists
-            if os.path.exists(dest_path):
-                response = QMessageBox.question(
-                    self, "File Exists",
-                    f"A file named '{file_name}' already exists in the destination. Overwrite?",
-                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-                )
-                
-                if response == QMessageBox.No:
-                    continue
-            
-            try:
-                # Copy the file
-                if os.path.isdir(file_path):
-                    shutil.copytree(file_path, dest_path)
-                else:
-                    shutil.copy2(file_path, dest_path)
-                
-                copied_count += 1
-                
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Error", f"Failed to copy file {file_name}: {str(e)}"
-                )
-        
-        if copied_count > 0:
-            self.statusBar().showMessage(f"Copied {copied_count} files to {dest_dir}")
+        items = self._confirm_destinations(selected_files, dest_dir)
+        if items:
+            self._run_file_operation("copy", items, dest_dir, "Copying Files")
     
     def delete_selected_file(self):
         """Delete the selected file"""
@@ -2785,10 +4238,13 @@ class MainWindow(QMainWindow):
         
         # Confirm deletion
         if len(selected_files) == 1:
-            file_name = os.path.basename(selected_files[0])
-            message = f"Are you sure you want to delete '{file_name}'?"
+            target = f"'{os.path.basename(selected_files[0])}'"
+        else:
+            target = f"{len(selected_files)} items"
+        if get_trash_function() is not None:
+            message = f"Are you sure you want to move {target} to the trash?"
         else:
-            message = f"Are you sure you want to delete {len(selected_files)} items?"
+            message = f"Are you sure you want to delete {target}?"
         
         response = QMessageBox.question(
             self, "Confirm Delete", message,
@@ -2798,31 +4254,74 @@ class MainWindow(QMainWindow):
         if response == QMessageBox.No:
             return
         
-        deleted_count = 0
+        self._run_file_operation("delete", [(file_path, None) for file_path in selected_files], "", "Deleting Files")
+    
+    def _confirm_destinations(self, selected_files, dest_dir):
+        """Pair each file with its path in dest_dir, asking before overwriting"""
+        items = []
         for file_path in selected_files:
-            try:
-                # Delete the file or directory
-                if os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-                else:
-                    os.remove(file_path)
-                
-                # Update the view
-                self.file_view.remove_file(file_path)
-                
-                # Update preview if needed
-                if self.preview_panel.current_file == file_path:
-                    self.preview_panel.set_file(None)
-                
-                deleted_count += 1
-                
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Error", f"Failed to delete {os.path.basename(file_path)}: {str(e)}"
+            file_name = os.path.basename(file_path)
+            dest_path = os.path.join(dest_dir, file_name)
+            
+            # Check if destination already exists
+            if os.path.exists(dest_path):
+                response = QMessageBox.question(
+                    self, "File Exists",
+                    f"A file named '{file_name}' already exists in the destination. Overwrite?",
+                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No
                 )
+                
+                if response == QMessageBox.No:
+                    continue
+            
+            items.append((file_path, dest_path))
+        return items
+    
+    def _run_file_operation(self, operation, items, dest_dir, title):
+        """Move, copy or delete files on a worker thread behind a progress dialog"""
+        # Create progress dialog
+        progress_dialog = ProgressDialog(self, title)
+        
+        # Create and start worker
+        self.file_operation_worker = FileOperationWorker(operation, items, dest_dir)
+        
+        # Connect signals
+        self.file_operation_worker.progress_updated.connect(progress_dialog.update_progress)
+        self.file_operation_worker.status_updated.connect(progress_dialog.update_status)
+        self.file_operation_worker.operation_completed.connect(
+            lambda success, message: self.on_file_operation_completed(success, message, progress_dialog)
+        )
+        
+        # Connect cancel button
+        progress_dialog.rejected.connect(self.file_operation_worker.cancel)
+        
+        # Start worker
+        self.file_operation_worker.start()
         
-        if deleted_count > 0:
-            self.statusBar().showMessage(f"Deleted {deleted_count} items")
+        # Show dialog
+        progress_dialog.exec_()
+    
+    def on_file_operation_completed(self, success: bool, message: str, dialog: QDialog):
+        """Update the view after a move, copy or delete has finished"""
+        # Close the progress dialog
+        dialog.accept()
+        
+        worker = self.file_operation_worker
+        if worker.operation != "copy":
+            # Moved and deleted files are gone from their folder
+            if self.preview_panel.current_file in worker.completed:
+                self.preview_panel.set_file(None)
+            # Update the view once for the whole batch
+            self.file_view.remove_files(worker.completed)
+        
+        if worker.failures:
+            details = "\n".join(f"{os.path.basename(source)}: {error}" for source, error in worker.failures[:10])
+            if len(worker.failures) > 10:
+                details += f"\n... and {len(worker.failures) - 10} more"
+            self._show_operation_error("Error", f"Failed to {worker.operation} {len(worker.failures)} items:\n{details}")
+        
+        # Update status bar
+        self.statusBar().showMessage(message)
     
     def start_organize(self):
         """Start the file organization process"""
@@ -2883,6 +4382,14 @@ class MainWindow(QMainWindow):
         # Show dialog
         progress_dialog.exec_()
     
+    def start_encrypt(self):
+        """Encrypt the selected files"""
+        self.start_encryption("encrypt")
+    
+    def start_decrypt(self):
+        """Decrypt the selected files"""
+        self.start_encryption("decrypt")
+    
     def start_encryption(self, operation):
         """Start the encryption/decryption process"""
         selected_files = self.file_view.get_selected_files()
@@ -2933,33 +4440,95 @@ class MainWindow(QMainWindow):
         # Show dialog
         progress_dialog.exec_()
     
+    def _show_toast(self, message: str):
+        """Briefly show a message over the window without blocking it"""
+        toast = QLabel(message, self, Qt.ToolTip)
+        toast.setStyleSheet(f"""
+            background-color: {AppTheme.CARD_BG};
+            color: {AppTheme.TEXT_PRIMARY};
+            border: 1px solid {AppTheme.SUCCESS};
+            border-radius: 6px;  /* CUSTOMIZABLE: Toast corner radius */
+            padding: 10px 16px;  /* CUSTOMIZABLE: Toast padding */
+        """)
+        toast.adjustSize()
+        # Centered just above the status bar
+        toast.move(self.mapToGlobal(QPoint((self.width() - toast.width()) // 2,
+                                           self.height() - toast.height() - 48)))
+        toast.show()
+        QTimer.singleShot(3000, toast.deleteLater)  # CUSTOMIZABLE: How long the toast stays visible (ms)
+    
+    def _show_operation_error(self, title: str, message: str):
+        """Show why an operation failed in the shared error dialog"""
+        if self._error_box is None:
+            self._error_box = QMessageBox(QMessageBox.Critical, title, message, QMessageBox.Ok, self)
+        else:
+            self._error_box.setWindowTitle(title)
+            self._error_box.setText(message)
+        self._error_box.exec_()
+    
     def on_operation_completed(self, success: bool, message: str, dialog: QDialog):
         """Handle operation completion"""
         # Close the progress dialog
         dialog.accept()
         
-        # Show message box
         if success:
-            QMessageBox.information(self, "Operation Complete", message)
-            # Refresh the file view if needed
-            self.refresh_files()
+            # Report success without a modal box, so the window stays usable
+            self._show_toast(message)
+            # Refresh the file view once the dialog has closed, restarting
+            # the timer merges back-to-back operations into one rescan
+            self._refresh_timer.start()
         else:
-            QMessageBox.critical(self, "Operation Failed", message)
+            self._show_operation_error("Operation Failed", message)
         
         # Update status bar
         self.statusBar().showMessage(message)
     
     def keyPressEvent(self, event):
         """Handle key press events"""
-        # Check if backspace key is pressed and we're not in a text field
-        if event.key() == Qt.Key_Backspace:
-            focused_widget = QApplication.focusWidget()
-            if not isinstance(focused_widget, QLineEdit) and not isinstance(focused_widget, QTextEdit):
-                self.navigate_to_parent_folder()
-                return
+        if event.key() != Qt.Key_Backspace:
+            super().keyPressEvent(event)
+            return
+        
+        # Backspace goes to the parent folder unless it is editing text
+        focused_widget = QApplication.focusWidget()
+        if focused_widget is None or not any(focused_widget.inherits(c) for c in self._TEXT_INPUT_CLASSES):
+            self.navigate_to_parent_folder()
+            return
         
         super().keyPressEvent(event)
 
+class _ErrorReporter(QObject):
+    """Logs unhandled exceptions from any thread and shows them on the GUI thread"""
+    error = pyqtSignal(str)
+    
+    def __init__(self):
+        super().__init__()
+        self._dialog = None
+        # Queued so the dialog opens from the event loop, never from inside the failing code
+        self.error.connect(self._show_error, Qt.QueuedConnection)
+    
+    def excepthook(self, exc_type, exc_value, exc_traceback):
+        """Replacement for sys.excepthook"""
+        if issubclass(exc_type, KeyboardInterrupt):
+            sys.__excepthook__(exc_type, exc_value, exc_traceback)
+            return
+        logger.error(f"Unhandled exception: {str(exc_value)}", exc_info=(exc_type, exc_value, exc_traceback))
+        self.error.emit(str(exc_value))
+    
+    def dialog(self, message: str) -> QMessageBox:
+        """The error dialog, created once and showing the given message"""
+        if self._dialog is None:
+            self._dialog = QMessageBox()
+            self._dialog.setIcon(QMessageBox.Critical)
+            self._dialog.setText("An unexpected error occurred")
+            self._dialog.setWindowTitle("Error")
+        self._dialog.setInformativeText(message)
+        return self._dialog
+    
+    def _show_error(self, message: str):
+        # Later errors update the open dialog instead of stacking more of them
+        self.dialog(message).show()
+
 # Application entry point
 def main():
     # Create application
@@ -2969,24 +4538,23 @@ def main():
     # Set up theme
     AppTheme.setup_application_style(app)
     
+    # Exceptions in slots and worker threads are reported while the app keeps running
+    reporter = _ErrorReporter()
+    sys.excepthook = reporter.excepthook
+    threading.excepthook = lambda args: reporter.excepthook(args.exc_type, args.exc_value, args.exc_traceback)
+    
+    # Create and show main window
     try:
-        # Create and show main window
         window = MainWindow()
-        window.show()
-        
-        # Run application
-        sys.exit(app.exec_())
     except Exception as e:
-        # Log any unhandled exceptions
+        # The event loop is not running yet, so show the error before exiting
         logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
-        # Show error message
-        error_dialog = QMessageBox()
-        error_dialog.setIcon(QMessageBox.Critical)
-        error_dialog.setText("An unexpected error occurred")
-        error_dialog.setInformativeText(str(e))
-        error_dialog.setWindowTitle("Error")
-        error_dialog.exec_()
+        reporter.dialog(str(e)).exec_()
         sys.exit(1)
+    window.show()
+    
+    # Run application
+    sys.exit(app.exec_())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file